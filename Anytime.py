@@ -0,0 +1,35 @@
+import threading
+import time
+
+
+class CancellationToken:
+    """Stop signal for the solvers' incumbents() generators: cancel() from any thread, or a deadline.
+
+    Pass a multiprocessing.Event as `cancelled` to share one signal between processes."""
+
+    def __init__(self, time_limit=None, cancelled=None):
+        self.deadline = None if time_limit is None else time.time() + time_limit
+        self.cancelled = cancelled if cancelled is not None else threading.Event()
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def expired(self):
+        return self.cancelled.is_set() or (self.deadline is not None and time.time() > self.deadline)
+
+
+def solve_anytime(incumbents, on_incumbent=None, upper_bound=None):
+    """Drain a solver's incumbents() generator and return the best path it found.
+
+    Every solver (DFS, DijkstraMax, aStar, Grasp) yields each improved path as soon as it has it and stops at
+    the next unit of work (a start vertex, a source, an endpoint pair or an iteration) once its token expires,
+    so the last path yielded is always the best one so far. on_incumbent(path) is called for every path.
+    With an upper bound on the vertex count (see Bounds), the solver is closed as soon as a path reaches it."""
+    best_path = []
+    for best_path in incumbents:
+        if on_incumbent is not None:
+            on_incumbent(best_path)
+        if upper_bound is not None and len(best_path) >= upper_bound:
+            incumbents.close()
+            break
+    return best_path
@@ -0,0 +1,91 @@
+from array import array
+
+
+class BitmaskDP:
+    """Exact longest simple path by dynamic programming over vertex subsets, for small components."""
+
+    max_vertices = 20  # 2^n subsets of n-bit end sets, beyond this use BranchAndBound instead
+
+    def __init__(self, graph, lcc):
+        if len(lcc) > self.max_vertices:
+            raise ValueError(f"BitmaskDP supports at most {self.max_vertices} vertices, got {len(lcc)}")
+        self.graph = graph
+        self.lcc = list(lcc)
+        index = {v: i for i, v in enumerate(self.lcc)}
+        # adjacency[i] is the bitset of LCC neighbors of the i-th LCC vertex
+        self.adjacency = [0] * len(self.lcc)
+        for i, v in enumerate(self.lcc):
+            for w in graph.vertices[v]:
+                if w in index:
+                    self.adjacency[i] |= 1 << index[w]
+
+    def find_longest_path(self):
+        """Return (length in edges, path); the path is always optimal."""
+        n = len(self.lcc)
+        if n == 0:
+            return -1, []
+        # ends[mask] is the bitset of vertices v such that some simple path visits exactly `mask` and ends at v
+        ends = array('Q', bytes(8 << n))
+        for v in range(n):
+            ends[1 << v] = 1 << v
+
+        best_mask, best_count = 1, 1
+        for mask, count in self.extend_paths(ends):
+            if count > best_count:
+                best_mask, best_count = mask, count
+                if count == n:
+                    break  # Hamiltonian path found
+
+        return best_count - 1, self.reconstruct(ends, best_mask)
+
+    def longest_paths_from(self, start):
+        """Longest simple path from start to every vertex of the component, as a dict end -> path."""
+        n = len(self.lcc)
+        start_bit = 1 << self.lcc.index(start)
+        ends = array('Q', bytes(8 << n))
+        ends[start_bit] = start_bit  # Only paths that begin at start are ever extended
+
+        best = {}  # End bit -> (vertex count, mask)
+        for mask, count in self.extend_paths(ends):
+            mask_ends = ends[mask]
+            while mask_ends:
+                low = mask_ends & -mask_ends
+                mask_ends ^= low
+                if count > best.get(low, (0, 0))[0]:
+                    best[low] = (count, mask)
+
+        paths = {}
+        for end_bit, (_, mask) in best.items():
+            path = self.reconstruct(ends, mask, end_bit)
+            path.reverse()
+            paths[path[-1]] = path
+        return paths
+
+    def extend_paths(self, ends):
+        # Fill ends[] in increasing mask order, yielding (mask, vertex count) for every subset that some path covers
+        adjacency = self.adjacency
+        for mask in range(1, 1 << len(self.lcc)):
+            mask_ends = ends[mask]
+            if not mask_ends:
+                continue
+            yield mask, bin(mask).count('1')
+            while mask_ends:
+                low = mask_ends & -mask_ends
+                mask_ends ^= low
+                free = adjacency[low.bit_length() - 1] & ~mask
+                while free:
+                    bit = free & -free
+                    free ^= bit
+                    ends[mask | bit] |= bit
+
+    def reconstruct(self, ends, mask, end_bit=None):
+        # Walk back from an end of `mask`, each time to a neighbor that ends a path over the remaining subset
+        if end_bit is None:
+            end_bit = ends[mask] & -ends[mask]
+        path = [self.lcc[end_bit.bit_length() - 1]]
+        while mask != end_bit:
+            mask ^= end_bit
+            previous = ends[mask] & self.adjacency[end_bit.bit_length() - 1]
+            end_bit = previous & -previous
+            path.append(self.lcc[end_bit.bit_length() - 1])
+        return path
@@ -0,0 +1,274 @@
+from concurrent.futures import ProcessPoolExecutor
+import time
+
+from BitmaskDP import BitmaskDP
+from Reduction import Reduction
+
+
+class BlockCutTree:
+    """Biconnected blocks and articulation points of the LCC, used to split the longest path search."""
+
+    def __init__(self, graph, lcc):
+        self.graph = graph
+        self.lcc = lcc
+        self.in_lcc = graph.new_vertex_state(False)
+        for v in lcc:
+            self.in_lcc[v] = True
+        self.blocks = []  # Vertex lists of the biconnected blocks
+        self.cut_vertices = set()  # Articulation points
+        self.vertex_blocks = {}  # Cut vertex -> indices of the blocks containing it
+        self.exact = True  # False once any block had to be solved heuristically
+        self.decompose()
+
+    def decompose(self):
+        # Iterative Tarjan (Hopcroft-Tarjan) with an edge stack; each frame is (vertex, parent, neighbor iterator)
+        if not self.lcc:
+            return
+        if len(self.lcc) == 1:
+            self.blocks.append([self.lcc[0]])
+            return
+        adjacency = self.graph.adjacency()
+        discovery = self.graph.new_vertex_state(-1)
+        low = self.graph.new_vertex_state(0)
+        root = self.lcc[0]
+        discovery[root] = low[root] = 0
+        counter = 1
+        edge_stack = []
+        frames = [(root, None, iter(adjacency[root]))]
+
+        while frames:
+            v, parent, neighbors = frames[-1]
+            for w in neighbors:
+                if not self.in_lcc[w]:
+                    continue
+                if discovery[w] == -1:
+                    edge_stack.append((v, w))
+                    discovery[w] = low[w] = counter
+                    counter += 1
+                    frames.append((w, v, iter(adjacency[w])))
+                    break
+                if w != parent and discovery[w] < discovery[v]:
+                    edge_stack.append((v, w))  # Back edge
+                    low[v] = min(low[v], discovery[w])
+            else:
+                frames.pop()
+                if not frames:
+                    continue
+                u = frames[-1][0]
+                low[u] = min(low[u], low[v])
+                if low[v] >= discovery[u]:
+                    # u separates the subtree of v: the edges above (u, v) on the stack form one block
+                    block = {}
+                    while True:
+                        a, b = edge_stack.pop()
+                        block[a] = block[b] = True
+                        if (a, b) == (u, v):
+                            break
+                    self.blocks.append(list(block))
+
+        for index, block in enumerate(self.blocks):
+            for v in block:
+                self.vertex_blocks.setdefault(v, []).append(index)
+        self.vertex_blocks = {v: blocks for v, blocks in self.vertex_blocks.items() if len(blocks) > 1}
+        self.cut_vertices = set(self.vertex_blocks)
+
+    def find_longest_path(self, workers=1, block_time_limit=5, time_limit=None, incumbent=None):
+        """Return (length in edges, path, proven_optimal) by solving every block and stitching them together.
+
+        Each large block searches for at most block_time_limit seconds, and all of them stop searching once
+        time_limit seconds have passed since the call (None for no limit on either). A known simple path of the
+        LCC (incumbent) seeds the search of every large block it passes through, and is returned instead when
+        the stitched path is shorter."""
+        if not self.lcc:
+            return -1, [], True
+        incumbent = list(incumbent) if incumbent and self.is_simple_path(incumbent) else []
+        deadline = None if time_limit is None else time.time() + time_limit
+        # A simple path cannot leave a block and come back without repeating its cut vertex, so the part of the
+        # incumbent inside a block is one piece of it and a simple path of that block
+        tasks = []
+        for block in self.blocks:
+            in_block = set(block)
+            tasks.append((block, [v for v in block if v in self.cut_vertices], [v for v in incumbent if v in in_block]))
+        if workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_block_worker,
+                                     initargs=(self.graph, block_time_limit, deadline)) as executor:
+                solutions = list(executor.map(_solve_block_task, tasks, chunksize=max(1, len(tasks) // (4 * workers))))
+        else:
+            solutions = [solve_block(self.graph, block, cuts, block_time_limit, deadline, seed)
+                         for block, cuts, seed in tasks]
+        self.exact = all(exact for _, _, exact in solutions)
+        length, path = self.stitch(solutions)
+        if len(incumbent) - 1 > length:
+            return len(incumbent) - 1, incumbent, False
+        return length, path, self.exact
+
+    def is_simple_path(self, path):
+        if len(path) != len(set(path)) or not all(self.in_lcc[v] for v in path):
+            return False
+        return all(path[i + 1] in self.graph.vertices[path[i]] for i in range(len(path) - 1))
+
+    def stitch(self, solutions):
+        # Root the block-cut tree at block 0. down[b] is the best path that starts at the parent cut vertex of
+        # block b and only goes through b and its subtree; ext[c] keeps the best two down paths among the child
+        # blocks of cut vertex c. Every path has a highest tree node: a block, or a cut vertex joining two children.
+        parent_cut = {0: None}
+        order = [0]
+        for b in order:
+            for c in self.blocks[b]:
+                if c in self.cut_vertices and c != parent_cut[b]:
+                    for child in self.vertex_blocks[c]:
+                        if child != b:
+                            parent_cut[child] = c
+                            order.append(child)
+
+        self.solutions = solutions
+        self.down = {}  # Block -> (length, end vertex in the block, path in the block from its parent cut)
+        self.ext = {}  # Cut vertex -> [(length, child block)], best two first
+        best = (0, 'block', None, [self.blocks[0][0]])
+
+        for b in reversed(order):
+            (length, path), from_cut, _ = solutions[b]
+            p = parent_cut[b]
+            if length > best[0]:
+                best = (length, 'block', b, path)
+
+            for x, table in from_cut.items():
+                for y, inner_length in table.lengths.items():
+                    if y != x:
+                        total = self.extension(x, p) + inner_length + self.extension(y, p)
+                        if total > best[0]:
+                            best = (total, 'joined', b, (x, y))
+
+            if p is not None:
+                down_best = (0, p)
+                for y, inner_length in from_cut[p].lengths.items():
+                    if y != p and inner_length + self.extension(y, p) > down_best[0]:
+                        down_best = (inner_length + self.extension(y, p), y)
+                self.down[b] = down_best + (from_cut[p].path(down_best[1]),)
+                children = self.ext.setdefault(p, [])
+                children.append((down_best[0], b))
+                children.sort(key=lambda child: child[0], reverse=True)
+                del children[2:]
+
+        for c, children in self.ext.items():
+            total = sum(length for length, _ in children)
+            if total > best[0]:
+                best = (total, 'cut', c, None)
+
+        return best[0], self.expand(best, parent_cut)
+
+    def extension(self, v, parent):
+        # Length of the best way to continue a path from v into the child blocks of v (never towards the root)
+        return self.ext[v][0][0] if v != parent and v in self.ext else 0
+
+    def walk_down(self, v, parent=None):
+        # Path starting at v that follows the best child extensions, as counted by extension(v, parent)
+        path = [v]
+        while v != parent and v in self.ext and self.ext[v][0][0] > 0:
+            _, v, inner = self.down[self.ext[v][0][1]]
+            path.extend(inner[1:])
+            parent = None
+        return path
+
+    def expand(self, best, parent_cut):
+        _, kind, where, path = best
+        if kind == 'block':
+            return list(path)
+        if kind == 'joined':
+            x, y = path
+            path = self.solutions[where][1][x].path(y)
+            head = self.walk_down(path[0], parent_cut[where])
+            tail = self.walk_down(path[-1], parent_cut[where])
+            head.reverse()
+            return head + path[1:-1] + tail
+        # Highest node is cut vertex `where`, joining the down paths of its two best child blocks
+        halves = []
+        for _, b in self.ext[where]:
+            _, y, inner = self.down[b]
+            halves.append(inner + self.walk_down(y)[1:])
+        if len(halves) == 1:
+            return halves[0]
+        halves[0].reverse()
+        return halves[0] + halves[1][1:]
+
+
+class PathTable:
+    """Longest known paths from one start vertex to each end vertex of a block."""
+
+    def __init__(self, start, paths=None):
+        self.start = start
+        self.paths = paths if paths is not None else {}  # End -> explicit path
+        self.lengths = {end: len(path) - 1 for end, path in self.paths.items()}
+        self.predecessor = {}  # End -> previous vertex, for ends stored as a tree instead
+
+    def path(self, end):
+        if end in self.paths:
+            return list(self.paths[end])
+        path = [end]
+        while path[-1] != self.start:
+            path.append(self.predecessor[path[-1]])
+        path.reverse()
+        return path
+
+
+def solve_block(graph, block, cuts, time_limit, deadline=None, incumbent=None):
+    """Solve one block: (longest path inside it as (length, path), {cut: PathTable}, exact).
+
+    The search over a large block runs for time_limit seconds at most, and not past the deadline (a time.time()
+    value) shared by all the blocks; either can be None. It starts from the incumbent path of the block when
+    that is longer than its own seed."""
+    if len(block) <= BitmaskDP.max_vertices:
+        dp = BitmaskDP(graph, block)
+        length, path = dp.find_longest_path()
+        return (length, path), {c: PathTable(c, dp.longest_paths_from(c)) for c in cuts}, True
+
+    # Too large for the subset DP: use DFS tree paths from each cut vertex (the DFS heuristic) and a time-limited
+    # search over the block with its degree-2 chains contracted, seeded with the deepest tree path
+    from_cut = {c: dfs_tree_paths(graph, block, c) for c in cuts}
+    tables = list(from_cut.values()) or [dfs_tree_paths(graph, block, block[0])]
+    deepest = max(tables, key=lambda table: max(table.lengths.values()))
+    seed = deepest.path(max(deepest.lengths, key=deepest.lengths.get))
+    if incumbent is not None and len(incumbent) > len(seed):
+        seed = incumbent
+    if deadline is not None:
+        remaining = max(0.0, deadline - time.time())
+        time_limit = remaining if time_limit is None else min(time_limit, remaining)
+    length, path, _ = Reduction(graph, block, incumbent=seed).find_longest_path(time_limit=time_limit)
+    return (length, path), from_cut, False
+
+
+def dfs_tree_paths(graph, block, start):
+    # Iterative DFS restricted to the block; the tree path to every vertex is its candidate path from start
+    in_block = set(block)
+    adjacency = graph.adjacency()
+    table = PathTable(start)
+    table.lengths[start] = 0
+    stack = [(start, iter(adjacency[start]))]
+    while stack:
+        u, neighbors = stack[-1]
+        for w in neighbors:
+            if w in in_block and w not in table.lengths:
+                table.lengths[w] = table.lengths[u] + 1
+                table.predecessor[w] = u
+                stack.append((w, iter(adjacency[w])))
+                break
+        else:
+            stack.pop()
+    return table
+
+
+_worker_graph = None
+_worker_time_limit = None
+_worker_deadline = None
+
+
+def _init_block_worker(graph, time_limit, deadline):
+    global _worker_graph, _worker_time_limit, _worker_deadline
+    _worker_graph = graph
+    _worker_time_limit = time_limit
+    _worker_deadline = deadline
+
+
+def _solve_block_task(task):
+    block, cuts, incumbent = task
+    return solve_block(_worker_graph, block, cuts, _worker_time_limit, _worker_deadline, incumbent)
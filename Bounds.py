@@ -0,0 +1,97 @@
+from BlockCutTree import BlockCutTree
+
+
+class Bounds:
+    """Cheap upper bounds on the number of vertices of any simple path in the LCC."""
+
+    def __init__(self, graph, lcc, block_cut_tree=None):
+        self.graph = graph
+        self.lcc = lcc
+        self.block_cut_tree = block_cut_tree  # Built on first use by block_cut_bound when not given
+        self.bound = None  # Cached result of upper_bound
+
+    def degree_bound(self):
+        # A vertex with a single neighbor can only be an end of the path, so all but two of them are left out
+        adjacency = self.graph.adjacency()
+        leaves = sum(1 for v in self.lcc if len({w for w in adjacency[v] if w != v}) == 1)
+        return len(self.lcc) - max(0, leaves - 2)
+
+    def sides(self, vertices):
+        # Sizes of the two color classes of the subgraph induced by `vertices`, or None if it has an odd cycle
+        adjacency = self.graph.adjacency()
+        color = {v: None for v in vertices}
+        counts = [0, 0]
+        for root in vertices:
+            if color[root] is not None:
+                continue
+            color[root] = 0
+            counts[0] += 1
+            queue = [root]
+            for u in queue:
+                for w in adjacency[u]:
+                    if w not in color:
+                        continue
+                    if color[w] is None:
+                        color[w] = 1 - color[u]
+                        counts[color[w]] += 1
+                        queue.append(w)
+                    elif color[w] == color[u]:
+                        return None
+        return counts
+
+    def parity_bound(self, vertices):
+        # A path alternates between the two sides of a bipartite graph, so it has at most one extra vertex of
+        # the larger side
+        counts = self.sides(vertices)
+        if counts is None:
+            return len(vertices)
+        return min(len(vertices), 2 * min(counts) + 1)
+
+    def bipartite_bound(self):
+        return self.parity_bound(self.lcc)
+
+    def block_cut_bound(self):
+        # A path goes through the blocks along one path of the block-cut tree, sharing a cut vertex between
+        # consecutive blocks. Each block counts at most its own parity bound.
+        if self.block_cut_tree is None:
+            self.block_cut_tree = BlockCutTree(self.graph, self.lcc)
+        tree = self.block_cut_tree
+        if not tree.blocks:
+            return 0
+        weight = [len(block) if len(block) <= 3 else self.parity_bound(block) for block in tree.blocks]
+
+        # Root the tree at block 0; down[b] is the heaviest chain of blocks from b into its subtree
+        parent_cut = {0: None}
+        order = [0]
+        for b in order:
+            for c in tree.blocks[b]:
+                if c in tree.cut_vertices and c != parent_cut[b]:
+                    for child in tree.vertex_blocks[c]:
+                        if child != b:
+                            parent_cut[child] = c
+                            order.append(child)
+
+        down = {}
+        best = 0
+        for b in reversed(order):
+            # Through b: its two best chains out of different child cut vertices, each sharing that cut with b
+            chains = sorted((max(down[child] for child in tree.vertex_blocks[c] if child != b) - 1
+                             for c in tree.blocks[b] if c in tree.cut_vertices and c != parent_cut[b]),
+                            reverse=True)
+            down[b] = weight[b] + (chains[0] if chains else 0)
+            best = max(best, weight[b] + sum(chains[:2]))
+        for c in tree.cut_vertices:
+            # Through c: two of the blocks below it
+            below = sorted((down[b] for b in tree.vertex_blocks[c] if parent_cut[b] == c), reverse=True)
+            best = max(best, sum(below[:2]) - 1)
+        return best
+
+    def upper_bound(self):
+        """Most vertices a simple path of the LCC can have."""
+        if self.bound is None:
+            self.bound = min(self.degree_bound(), self.bipartite_bound(), self.block_cut_bound()) if self.lcc else 0
+        return self.bound
+
+    def gap(self, path):
+        """Edges by which the best possible path could still be longer than `path`."""
+        return self.upper_bound() - len(path)
@@ -0,0 +1,101 @@
+import time
+
+
+class BranchAndBound:
+    """Exact longest simple path search that prunes branches which cannot beat the incumbent."""
+
+    def __init__(self, graph, lcc, incumbent=None, time_limit=None, shared_best=None, upper_bound=None):
+        self.graph = graph
+        self.lcc = lcc
+        self.in_lcc = graph.new_vertex_state(False)
+        for v in lcc:
+            self.in_lcc[v] = True
+        self.time_limit = time_limit  # Seconds, None searches until optimality is proven
+        self.best_path = list(incumbent) if incumbent and self.is_simple_path(incumbent) else []
+        self.proven_optimal = False
+        self.nodes = 0  # Number of search nodes expanded
+        self.mark = graph.new_vertex_state(0)  # Visit stamps for the reachability bound
+        self.stamp = 0
+        # Vertex count of the best path any solver of a portfolio has found (a multiprocessing.Value), read
+        # into self.floor from time to time; branches that cannot beat it are pruned as well
+        self.shared_best = shared_best
+        self.floor = 0
+        self.upper_bound = len(lcc) if upper_bound is None else upper_bound  # Most vertices any path can have
+
+    def is_simple_path(self, path):
+        if len(path) != len(set(path)) or not all(v in self.graph.vertices and self.in_lcc[v] for v in path):
+            return False
+        return all(path[i + 1] in self.graph.vertices[path[i]] for i in range(len(path) - 1))
+
+    def reachable_exceeds(self, tip, on_path, needed):
+        # True if more than `needed` unvisited LCC vertices can be reached from tip (the BFS stops early)
+        self.stamp += 1
+        stamp, mark, adjacency = self.stamp, self.mark, self.graph.adjacency()
+        mark[tip] = stamp
+        queue = [tip]
+        count = 0
+        for u in queue:
+            for w in adjacency[u]:
+                if mark[w] != stamp and self.in_lcc[w] and not on_path[w]:
+                    mark[w] = stamp
+                    count += 1
+                    if count > needed:
+                        return True
+                    queue.append(w)
+        return False
+
+    def search_from(self, start, on_path, deadline, token=None):
+        # Iterative backtracking over all simple paths starting at `start`; returns False if time ran out
+        adjacency = self.graph.adjacency()
+        path = [start]
+        on_path[start] = True
+        if len(path) > len(self.best_path):
+            self.best_path = list(path)
+        stack = [iter(adjacency[start])]
+
+        while stack:
+            self.nodes += 1
+            if self.nodes % 1024 == 0:
+                if self.shared_best is not None:
+                    self.floor = self.shared_best.value
+                if (deadline is not None and time.time() > deadline) or (token is not None and token.expired()):
+                    for v in path:
+                        on_path[v] = False
+                    return False
+            for w in stack[-1]:
+                if not self.in_lcc[w] or on_path[w]:
+                    continue
+                on_path[w] = True
+                path.append(w)
+                if len(path) > len(self.best_path):
+                    self.best_path = list(path)
+                target = max(len(self.best_path), self.floor)
+                if target < self.upper_bound and self.reachable_exceeds(w, on_path, target - len(path)):
+                    stack.append(iter(adjacency[w]))
+                    break
+                path.pop()  # Bound cannot beat the incumbent, prune this branch
+                on_path[w] = False
+            else:
+                stack.pop()
+                on_path[path.pop()] = False
+        return True
+
+    def find_longest_path(self, token=None):
+        """Return (length in edges, path, proven_optimal); stops early like the time limit when the token expires.
+
+        With a shared best, proven_optimal means no path is longer than both this path and the shared one."""
+        deadline = None if self.time_limit is None else time.time() + self.time_limit
+        on_path = self.graph.new_vertex_state(False)
+        completed = True
+
+        for start in self.lcc:
+            if self.shared_best is not None:
+                self.floor = self.shared_best.value
+            if max(len(self.best_path), self.floor) >= self.upper_bound:
+                break  # A path reaching the upper bound cannot be beaten
+            if not self.search_from(start, on_path, deadline, token):
+                completed = False
+                break
+
+        self.proven_optimal = completed or max(len(self.best_path), self.floor) >= self.upper_bound
+        return len(self.best_path) - 1, self.best_path, self.proven_optimal
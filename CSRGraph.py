@@ -0,0 +1,146 @@
+from array import array
+from collections.abc import Mapping
+
+from UnionFind import UnionFind
+
+
+class AdjacencyView(Mapping):
+    """Read-only dict-like view of a CSRGraph, so code written against Graph.vertices keeps working."""
+
+    def __init__(self, csr):
+        self.csr = csr
+
+    def __getitem__(self, v):
+        if not 0 <= v < self.csr.n:
+            raise KeyError(v)
+        return self.csr.adjacency()[v]
+
+    def __iter__(self):
+        return iter(range(self.csr.n))
+
+    def __len__(self):
+        return self.csr.n
+
+    def __contains__(self, v):
+        return isinstance(v, int) and 0 <= v < self.csr.n
+
+
+class CSRGraph:
+    """Frozen compressed-sparse-row graph with dense integer vertex ids 0..n-1."""
+
+    def __init__(self, offsets, neighbors, labels=None, coordinates=None, components=None, original_counts=None):
+        # Arrays or memoryviews (e.g. of a GraphCache mapping)
+        self.offsets = offsets  # Neighbors of vertex i are neighbors[offsets[i]:offsets[i + 1]]
+        self.neighbors = neighbors
+        self.n = len(offsets) - 1
+        self.labels = list(range(self.n)) if labels is None else labels  # labels[i] is the original vertex id
+        self.coordinates = coordinates  # Flat array: x of vertex i at 2 * i, y at 2 * i + 1
+        self.label_index = None
+        self.vertices = AdjacencyView(self)
+        self._adjacency = None  # Neighbor tuples of every vertex, built on first use by adjacency
+        self.components = components  # UnionFind of the loader or the cache, built on first use otherwise
+        self.original_counts = original_counts  # (vertices, edges) of the whole file when only its LCC is held
+
+    def __getstate__(self):
+        # Memoryviews cannot be pickled, so ship plain arrays; the neighbor tuples are rebuilt on the other side
+        state = self.__dict__.copy()
+        del state['vertices']
+        state['_adjacency'] = None
+        state['offsets'] = array('q', self.offsets)
+        state['neighbors'] = array('i', self.neighbors)
+        state['labels'] = list(self.labels)
+        if self.coordinates is not None:
+            state['coordinates'] = array('d', self.coordinates)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.vertices = AdjacencyView(self)
+
+    @classmethod
+    def from_graph(cls, graph):
+        order = list(graph.vertices)
+        index = {v: i for i, v in enumerate(order)}
+        offsets = array('q', [0])
+        neighbors = array('i')
+        for v in order:
+            neighbors.extend(index[u] for u in graph.vertices[v])
+            offsets.append(len(neighbors))
+        coordinates = array('d')
+        for v in order:
+            coordinates.extend(graph.get_coordinates(v))
+        # The union-find kept while loading is over the same dense ids, so the components come for free
+        tracked = graph.components
+        components = tracked if graph.dense and tracked is not None and len(tracked.parent) == len(order) else None
+        return cls(offsets, neighbors, graph.to_labels(order), coordinates, components, graph.original_counts)
+
+    @classmethod
+    def from_edges(cls, n, edges, labels=None, coordinates=None):
+        """Build from (u, v) pairs of dense ids; duplicate edges and self-loops are dropped."""
+        adjacency = [set() for _ in range(n)]
+        for u, v in edges:
+            if u != v:
+                adjacency[u].add(v)
+                adjacency[v].add(u)
+        offsets = array('q', [0])
+        neighbors = array('i')
+        for neighbor_set in adjacency:
+            neighbors.extend(sorted(neighbor_set))
+            offsets.append(len(neighbors))
+        return cls(offsets, neighbors, labels, coordinates)
+
+    def adjacency(self):
+        """Neighbor tuples indexed by vertex id, for the solvers' inner loops.
+
+        Sliced out of the CSR arrays once, so a neighbor lookup is a plain list index instead of a method
+        call and a new slice every time."""
+        if self._adjacency is None:
+            offsets, neighbors = self.offsets, memoryview(self.neighbors).tolist()
+            self._adjacency = [tuple(neighbors[offsets[v]:offsets[v + 1]]) for v in range(self.n)]
+        return self._adjacency
+
+    def neighbors_of(self, v):
+        return self.adjacency()[v]
+
+    def degree(self, v):
+        return self.offsets[v + 1] - self.offsets[v]
+
+    def number_of_edges(self):
+        return len(self.neighbors) // 2
+
+    def get_coordinates(self, vertex):
+        if self.coordinates is None or not 0 <= vertex < self.n:
+            return None, None
+        return self.coordinates[2 * vertex], self.coordinates[2 * vertex + 1]
+
+    def connected_components(self):
+        if self.components is None:
+            components = UnionFind(self.n)
+            offsets, neighbors = self.offsets, self.neighbors
+            for u in range(self.n):
+                for v in neighbors[offsets[u]:offsets[u + 1]]:
+                    if u < v:
+                        components.union(u, v)
+            self.components = components
+        return self.components
+
+    def largest_component(self):
+        """Vertices of the largest connected component (the first one in vertex order on ties)."""
+        return self.connected_components().largest_component()
+
+    def component_size_histogram(self):
+        """Number of connected components of each size."""
+        return self.connected_components().size_histogram()
+
+    def new_vertex_state(self, default):
+        """Per-vertex state for the solvers, indexed by dense id."""
+        return [default] * self.n
+
+    def index_of(self, label):
+        if self.label_index is None:
+            self.label_index = {label: i for i, label in enumerate(self.labels)}
+        return self.label_index[label]
+
+    def to_labels(self, path):
+        """Translate a list of dense ids back to the original vertex ids."""
+        return [self.labels[v] for v in path]
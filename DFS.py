@@ -1,7 +1,10 @@
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 import math
+import multiprocessing
 from random import choice
 
+from Bounds import Bounds
 from Graph import Graph
 
 
@@ -15,9 +18,8 @@ class DFS:
         self.lsp_path = []
 
     def reset_vertices(self):
-        for v in self.graph.vertices:
-            self.color[v] = "WHITE"
-            self.predecessor[v] = None
+        self.color = self.graph.new_vertex_state("WHITE")
+        self.predecessor = self.graph.new_vertex_state(None)
 
     def DFS_LCC(self):
         self.reset_vertices()
@@ -31,7 +33,12 @@ class DFS:
         return largest_component
 
     def dfs_visit(self, vertex, current_length=0, current_path=None, component=None):
-        self.color[vertex] = 'GRAY'
+        # Iterative DFS: each stack frame is a vertex and the iterator over its remaining neighbors
+        adjacency = self.graph.adjacency()
+        color = self.color
+        predecessor = self.predecessor
+
+        color[vertex] = 'GRAY'
         if component is not None:
             component.append(vertex)
         if current_path is not None:
@@ -40,27 +47,112 @@ class DFS:
             if current_length > self.lsp_length:
                 self.lsp_length = current_length
                 self.lsp_path = list(current_path)
+        stack = [(vertex, iter(adjacency[vertex]))]
 
-        for next_vertex in self.graph.vertices[vertex]:
-            if self.color[next_vertex] == 'WHITE':
-                self.predecessor[next_vertex] = vertex
-                self.dfs_visit(next_vertex, current_length, current_path, component)
+        while stack:
+            u, neighbors = stack[-1]
+            for next_vertex in neighbors:
+                if color[next_vertex] == 'WHITE':
+                    predecessor[next_vertex] = u
+                    color[next_vertex] = 'GRAY'
+                    if component is not None:
+                        component.append(next_vertex)
+                    if current_path is not None:
+                        current_path.append(next_vertex)
+                        current_length += 1
+                        if current_length > self.lsp_length:
+                            self.lsp_length = current_length
+                            self.lsp_path = list(current_path)
+                    stack.append((next_vertex, iter(adjacency[next_vertex])))
+                    break
+            else:
+                stack.pop()
+                color[u] = 'BLACK'  #indicate full exploration of this vertex
+                if current_path is not None:
+                    current_path.pop()
+                    current_length -= 1
 
-        self.color[vertex] = 'BLACK'  #indicate full exploration of this vertex
-        if current_path is not None:
-            current_path.pop()
+    def find_lsp(self, largest_component=None, workers=1, upper_bound=None):
+        # Stops as soon as a path reaches the upper bound (vertex count), by default the one from Bounds
+        if largest_component is None:
+            largest_component = self.DFS_LCC()
+        if upper_bound is None:
+            upper_bound = Bounds(self.graph, largest_component).upper_bound()
+        if workers > 1 and len(largest_component) > 1:
+            return self.find_lsp_parallel(largest_component, workers, upper_bound)
+        for _ in self.incumbents(largest_component, upper_bound=upper_bound):
+            pass
+        return self.lsp_length - 1, self.lsp_path
 
-    def find_lsp(self):
-        largest_component = self.DFS_LCC()
+    def incumbents(self, largest_component=None, token=None, upper_bound=None):
+        """Yield the longest path so far each time a start vertex improves it, until the token expires or a
+        path reaches upper_bound vertices (the size of the component by default)."""
+        if largest_component is None:
+            largest_component = self.DFS_LCC()
+        if upper_bound is None:
+            upper_bound = len(largest_component)
         self.lsp_length = 0
         self.lsp_path = []
 
         for start_vertex in largest_component:
+            if (token is not None and token.expired()) or self.lsp_length >= upper_bound:
+                return
+            previous_length = self.lsp_length
             self.reset_vertices()
             self.dfs_visit(start_vertex, current_path=[])
+            if self.lsp_length > previous_length:
+                yield self.lsp_path
 
+    def find_lsp_parallel(self, largest_component, workers, upper_bound=None, chunks_per_worker=4):
+        # Start vertices are split into contiguous chunks across processes. The shared array holds the best
+        # vertex count and the index of the start that found it, so workers can skip starts that cannot win.
+        best = multiprocessing.Array('q', [0, len(largest_component)])
+        indexed_starts = list(enumerate(largest_component))
+        chunk_size = max(1, -(-len(indexed_starts) // (workers * chunks_per_worker)))
+        chunks = [indexed_starts[i:i + chunk_size] for i in range(0, len(indexed_starts), chunk_size)]
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_lsp_worker,
+                                 initargs=(self.graph, best, upper_bound or len(largest_component))) as executor:
+            results = list(executor.map(_lsp_from_starts, chunks))
+
+        # Same tie-breaking as the serial loop: the earliest start reaching the maximum wins
+        self.lsp_length, _, self.lsp_path = max(results, key=lambda result: (result[0], -result[1]))
         return self.lsp_length - 1, self.lsp_path
 
+
+_worker_dfs = None
+_worker_best = None
+_worker_upper_bound = 0
+
+
+def _init_lsp_worker(graph, best, upper_bound):
+    global _worker_dfs, _worker_best, _worker_upper_bound
+    _worker_dfs = DFS(graph)
+    _worker_best = best
+    _worker_upper_bound = upper_bound
+
+
+def _lsp_from_starts(indexed_starts):
+    # Returns (vertex count, start index, path) of the best path found from this chunk of start vertices
+    dfs = _worker_dfs
+    best_length, best_index, best_path = 0, float('inf'), []
+    for index, start_vertex in indexed_starts:
+        with _worker_best.get_lock():
+            shared_length, shared_index = _worker_best[0], _worker_best[1]
+        if shared_length >= _worker_upper_bound and shared_index < index:
+            break  # An earlier start already reached the upper bound, nothing later can replace it
+
+        dfs.lsp_length = 0
+        dfs.lsp_path = []
+        dfs.reset_vertices()
+        dfs.dfs_visit(start_vertex, current_path=[])
+        if dfs.lsp_length > best_length:
+            best_length, best_index, best_path = dfs.lsp_length, index, dfs.lsp_path
+            with _worker_best.get_lock():
+                if (best_length, -best_index) > (_worker_best[0], -_worker_best[1]):
+                    _worker_best[0], _worker_best[1] = best_length, best_index
+    return best_length, best_index, best_path
+
 """
 # Example usage
 g = Graph()
@@ -1,64 +1,158 @@
+from concurrent.futures import ProcessPoolExecutor
 import heapq
+import multiprocessing
+
 from Graph import Graph
-from PriorityQueueNode import PriorityQueueNode
 
 
 class DijkstraMax:
-    def __init__(self, graph, lcc_vertices):
+    def __init__(self, graph, lcc_vertices=None, workers=1):
         self.graph = graph
+        if lcc_vertices is None:
+            lcc_vertices = list(self.graph.vertices)
         self.lcc = {v: self.graph.vertices[v] for v in lcc_vertices if v in self.graph.vertices}  # Filtered LCC from the graph
+        self.workers = workers  # Processes used by get_longest_path
+
+        # Per-vertex state is allocated once and reset after every source through the touched list
+        self.distances = self.graph.new_vertex_state(float('-inf'))
+        self.predecessors = self.graph.new_vertex_state(None)
+        self.visited = self.graph.new_vertex_state(False)
+        # Queue entries are (-distance, tie, vertex), ordered by distance only like the original PriorityQueueNode
+        # entries, so equally long branches are followed in the same order and every path length stays the same.
+        # tie[v] is a NaN of v's own: NaN never compares less than another value, so the tuple comparison stops
+        # there instead of ordering equal distances by vertex id.
+        self.tie = self.graph.new_vertex_state(None)
+        for v in self.graph.vertices:
+            self.tie[v] = float('nan')
+        self.touched = []  # Vertices whose distance is set for the current source
         self.Q = []  # Priority queue
 
     def initialize_single_source_max(self, s):
-        self.distances = {v: float('-inf') for v in self.graph.vertices}
-        self.predecessors = {v: None for v in self.graph.vertices}
+        for v in self.touched:
+            self.distances[v] = float('-inf')
+            self.predecessors[v] = None
+            self.visited[v] = False
+        self.touched = [s]
         self.distances[s] = 0
-        heapq.heappush(self.Q, PriorityQueueNode(s, 0))
+        # The original loop initialized every source twice, queueing it twice. The spare entry is never expanded
+        # but it shapes the heap, and with it the order of equal distances, so it is kept.
+        self.Q = [(0, self.tie[s], s), (0, self.tie[s], s)]
 
     def relax_max(self, u, v):
         if self.distances[v] < self.distances[u] + 1:
+            if self.distances[v] == float('-inf'):
+                self.touched.append(v)
             self.distances[v] = self.distances[u] + 1
             self.predecessors[v] = u
-            heapq.heappush(self.Q, PriorityQueueNode(v, -self.distances[v]))
+            heapq.heappush(self.Q, (-self.distances[v], self.tie[v], v))
 
     def dijkstra_max(self, s):
         self.initialize_single_source_max(s)
-        visited = set()
+        adjacency, distances, predecessors = self.graph.adjacency(), self.distances, self.predecessors
+        visited, touched, tie, queue = self.visited, self.touched, self.tie, self.Q
+        push, pop = heapq.heappush, heapq.heappop
+        unreached = float('-inf')
 
-        while self.Q:
-            u = heapq.heappop(self.Q).vertex
-            if u in visited:
+        while queue:
+            u = pop(queue)[2]
+            if visited[u]:
                 continue
-            visited.add(u)
+            visited[u] = True
 
-            for v in self.graph.vertices[u]:
-                if v not in visited:
-                    self.relax_max(u, v)
+            distance = distances[u] + 1
+            for v in adjacency[u]:
+                if not visited[v] and distances[v] < distance:  # relax_max, inlined
+                    if distances[v] == unreached:
+                        touched.append(v)
+                    distances[v] = distance
+                    predecessors[v] = u
+                    push(queue, (-distance, tie[v], v))
 
-        # Reconstruct the LSP from the distances and predecessors
-        end_vertex = max(self.distances, key=self.distances.get)
-        path_length = self.distances[end_vertex]  # Length of the longest path
+        # Reconstruct the LSP from the distances and predecessors; ties go to the first vertex in graph order
+        if isinstance(distances, list):
+            end_vertex = distances.index(max(distances))
+        else:
+            end_vertex = max(self.graph.vertices, key=distances.__getitem__)
+        path_length = distances[end_vertex]  # Length of the longest path
         path = [end_vertex]
-        while self.predecessors[end_vertex] is not None:
-            path.append(self.predecessors[end_vertex])
-            end_vertex = self.predecessors[end_vertex]
+        while predecessors[end_vertex] is not None:
+            path.append(predecessors[end_vertex])
+            end_vertex = predecessors[end_vertex]
         path.reverse()
 
         return path, path_length  # Return both path and length
 
-    def get_longest_path(self):
-        longest_path_length = 0
+    def get_longest_path(self, upper_bound=None):
+        # Stops as soon as a path reaches the upper bound (vertex count), by default the size of the LCC
+        if upper_bound is None:
+            upper_bound = len(self.lcc)
+        if self.workers > 1 and len(self.lcc) > 1:
+            return self.get_longest_path_parallel(upper_bound)
         longest_path = []
+        for longest_path in self.incumbents(upper_bound=upper_bound):
+            pass
+        return max(len(longest_path) - 1, 0), longest_path
 
+    def incumbents(self, token=None, upper_bound=None):
+        """Yield the longest path so far each time a source improves it, until the token expires or a path
+        reaches upper_bound vertices (the size of the LCC by default)."""
+        if upper_bound is None:
+            upper_bound = len(self.lcc)
+        longest_path_length = 0
         for v in self.lcc:
-            self.initialize_single_source_max(v)
+            if (token is not None and token.expired()) or longest_path_length + 1 >= upper_bound:
+                return
             path, length = self.dijkstra_max(v)
             if length > longest_path_length:
                 longest_path_length = length
-                longest_path = path
+                yield path
 
+    def get_longest_path_parallel(self, upper_bound=None, chunks_per_worker=4):
+        # Sources are split into contiguous chunks across processes, each reusing one engine for its chunks. The
+        # shared value holds the index of the earliest source whose path reached the upper bound, so workers can
+        # skip sources that cannot win.
+        reached = multiprocessing.Value('q', len(self.lcc))
+        indexed_sources = list(enumerate(self.lcc))
+        chunk_size = max(1, -(-len(indexed_sources) // (self.workers * chunks_per_worker)))
+        chunks = [indexed_sources[i:i + chunk_size] for i in range(0, len(indexed_sources), chunk_size)]
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_dijkstra_worker,
+                                 initargs=(self.graph, reached, upper_bound or len(self.lcc))) as executor:
+            results = list(executor.map(_longest_from_sources, chunks))
+
+        # Same tie-breaking as the serial loop: the earliest source reaching the maximum wins
+        longest_path_length, _, longest_path = max(results, key=lambda result: (result[0], -result[1]))
         return longest_path_length, longest_path
 
+
+_worker_dijkstra = None
+_worker_reached = None
+_worker_upper_bound = 0
+
+
+def _init_dijkstra_worker(graph, reached, upper_bound):
+    global _worker_dijkstra, _worker_reached, _worker_upper_bound
+    _worker_dijkstra = DijkstraMax(graph, [])
+    _worker_reached = reached
+    _worker_upper_bound = upper_bound
+
+
+def _longest_from_sources(indexed_sources):
+    # Returns (length, source index, path) of the longest path found from this chunk of sources
+    best_length, best_index, best_path = 0, float('inf'), []
+    for index, s in indexed_sources:
+        if _worker_reached.value < index:
+            break  # An earlier source already reached the upper bound, nothing later can replace it
+        path, length = _worker_dijkstra.dijkstra_max(s)
+        if length > best_length:
+            best_length, best_index, best_path = length, index, path
+            if length + 1 >= _worker_upper_bound:
+                with _worker_reached.get_lock():
+                    _worker_reached.value = min(_worker_reached.value, index)
+                break
+    return best_length, best_index, best_path
+
+
 '''
 g = Graph()
 g.read_edges_from_file('graph.Edges.txt')
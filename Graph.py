@@ -1,14 +1,39 @@
+from array import array
+from itertools import chain
 import math
 import random
 
+from CSRGraph import CSRGraph
+from UnionFind import UnionFind
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the pure Python generator is used without it
+    np = None
+
 
 class Graph:
-    def __init__(self):
+    def __init__(self, track_components=False):
         self.vertices = {}
         self.coordinates = {}
+        self.dense = True  # True while the vertex ids are exactly 0..n-1
+        self.labels = []  # labels[v] is the original file id of dense vertex v (empty if not remapped)
+        self.label_ids = {}  # Original file id -> dense vertex id
+        self.components = UnionFind() if track_components else None  # Updated by add_vertex/add_edge
+        # (vertices, edges) of the whole file when read_largest_component_from_file kept only part of it
+        self.original_counts = None
+
+    def track_new_vertex(self, v, count=1):
+        # Called before vertices v .. v + count - 1 are added
+        if v != len(self.vertices):
+            self.dense = False
+            self.components = None  # Union-find needs dense ids, rebuilt on demand instead
+        elif self.components is not None:
+            self.components.add(count)
 
     def add_vertex(self, v):
         if v not in self.vertices:
+            self.track_new_vertex(v)
             x = random.random()  # Random x-coordinate between 0 and 1
             y = random.random()  # Random y-coordinate between 0 and 1
             self.vertices[v] = []
@@ -20,6 +45,63 @@ class Graph:
                 self.vertices[u].append(v)
             if u not in self.vertices[v]:
                 self.vertices[v].append(u)
+            if self.components is not None:
+                self.components.union(u, v)
+
+    def connected_components(self):
+        """Union-find over vertex positions; the one kept while loading when available."""
+        if self.components is not None and len(self.components.parent) == len(self.vertices):
+            return self.components
+        index = {v: i for i, v in enumerate(self.vertices)}
+        components = UnionFind(len(index))
+        for u, neighbors in self.vertices.items():
+            for v in neighbors:
+                components.union(index[u], index[v])
+        if self.dense:
+            self.components = components
+        return components
+
+    def largest_component(self):
+        """Vertices of the largest connected component (the first one in vertex order on ties)."""
+        members = self.connected_components().largest_component()
+        if self.dense:
+            return members
+        order = list(self.vertices)
+        return [order[i] for i in members]
+
+    def component_size_histogram(self):
+        """Number of connected components of each size."""
+        return self.connected_components().size_histogram()
+
+    def compile(self):
+        """Freeze the adjacency dict into a CSRGraph with dense vertex ids for the solvers."""
+        return CSRGraph.from_graph(self)
+
+    def vertex_id(self, label):
+        """Map an original file id to a dense vertex id, assigning the next free id on first sight."""
+        v = self.label_ids.get(label)
+        if v is None:
+            v = len(self.labels)
+            self.labels.append(label)
+            self.label_ids[label] = v
+        return v
+
+    def label(self, v):
+        return self.labels[v] if self.labels else v
+
+    def to_labels(self, path):
+        """Translate a list of dense ids back to the original vertex ids."""
+        return [self.label(v) for v in path]
+
+    def adjacency(self):
+        """Neighbor lists indexed by vertex, for the solvers' inner loops (CSRGraph has the same method)."""
+        return self.vertices
+
+    def new_vertex_state(self, default):
+        """Per-vertex state for the solvers: a plain list when ids are dense, a dict otherwise."""
+        if self.dense:
+            return [default] * len(self.vertices)
+        return dict.fromkeys(self.vertices, default)
 
     def get_coordinates(self, vertex):
         return self.coordinates.get(vertex, (None, None))  # Return None if vertex doesn't exist
@@ -28,12 +110,177 @@ class Graph:
         with open(file_path, 'r') as file:
             for line in file:
                 u, v = map(int, line.strip().split())  # Adjust split() accordingly if using a different delimiter
+                u, v = self.vertex_id(u), self.vertex_id(v)
                 if u not in self.vertices:
                     self.add_vertex(u)
                 if v not in self.vertices:
                     self.add_vertex(v)
                 self.add_edge(u, v)
 
+    def sniff_file_format(self, file):
+        """Read past the header of an open edge file and return (format, first edge line), '' if it has none.
+
+        'coordinates' lines are "u x1 y1 v x2 y2" and 'edges' lines are "u v". 'matrix market' files start with
+        a %%MatrixMarket banner (or are .mtx files with % comments), then have a size line and "u v" or
+        "u v value" lines. Other lines starting with % or # are comments."""
+        line = file.readline()
+        matrix_market = line.startswith('%%MatrixMarket')
+        header = False  # True once a comment line was read
+        while line and (not line.strip() or line.startswith(('%', '#'))):
+            header = header or line.startswith('%')
+            line = file.readline()
+        if matrix_market or (header and str(getattr(file, 'name', '')).endswith('.mtx')):
+            return 'matrix market', file.readline() if line else line  # Skip the "rows columns entries" line
+        if len(line.split()) == 6:
+            return 'coordinates', line
+        return 'edges', line
+
+    def edge_chunks(self, file_path, chunk_bytes=1 << 22):
+        """Stream an edge file of any supported format in chunks of whole lines.
+
+        Yields (ends, point): the vertex labels of the edge ends u0, v0, u1, v1, ... of the chunk, and a function
+        parsing the coordinates of end i of the chunk, or None when the file has no coordinates. Yields nothing
+        for a file without edge lines."""
+        with open(file_path, 'r') as file:
+            file_format, line = self.sniff_file_format(file)
+            if not line:
+                return
+            coordinates = file_format == 'coordinates'
+            for lines in chain([[line]], iter(lambda: file.readlines(chunk_bytes), [])):
+                text = ''.join(lines)
+                tokens = text.split()
+                width = 6 if coordinates else len(line.split())  # Tokens per edge line
+                if '%' in text or '#' in text or len(tokens) != width * (len(lines) - lines.count('\n')):
+                    # Comments or lines of other lengths in this chunk: keep the ends (and points) line by line
+                    width = 6 if coordinates else 2
+                    tokens = []
+                    for chunk_line in lines:
+                        parts = chunk_line.split()
+                        if not parts or chunk_line.startswith(('%', '#')):
+                            continue
+                        if len(parts) < width:
+                            raise ValueError(f"{file_path}: expected {width} values in edge line {chunk_line!r}")
+                        tokens.extend(parts[:width])
+                second = 3 if coordinates else 1  # Token of the second end
+                ends = [0] * (2 * (len(tokens) // width))
+                ends[0::2] = map(int, tokens[0::width])
+                ends[1::2] = map(int, tokens[second::width])
+                if coordinates:
+                    def point(i, tokens=tokens):
+                        x = i // 2 * 6 + i % 2 * 3 + 1
+                        return float(tokens[x]), float(tokens[x + 1])
+                    yield ends, point
+                else:
+                    yield ends, None
+
+    def read_graph_from_file(self, file_path, chunk_bytes=1 << 22):
+        """Load an edge file of any supported format in one pass, reading it in large chunks of whole lines.
+
+        Builds the same graph as the add_vertex/add_edge readers, vertex ids in order of first appearance and
+        neighbors in file order without duplicates, but parses whole chunks at once and drops the duplicates
+        in one go at the end instead of scanning a neighbor list for every edge."""
+        labels, label_ids = self.labels, self.label_ids
+        first_new = len(labels)
+        new_coordinates = []
+        ends = []  # Dense ids of the edge ends in file order: u0, v0, u1, v1, ...
+        for chunk_labels, point in self.edge_chunks(file_path, chunk_bytes):
+            if point is not None:
+                # Position of the first appearance of every label, to parse only the points that are kept
+                first_position = dict(zip(reversed(chunk_labels), range(len(chunk_labels) - 1, -1, -1)))
+            for label in dict.fromkeys(chunk_labels):
+                if label not in label_ids:
+                    label_ids[label] = len(labels)
+                    labels.append(label)
+                    if point is not None:
+                        new_coordinates.append(point(first_position[label]))
+            ends.extend(map(label_ids.__getitem__, chunk_labels))
+
+        if len(labels) > first_new:
+            self.track_new_vertex(first_new, len(labels) - first_new)
+        appended = [[] for _ in labels]
+        union = self.components.union if self.components is not None else None
+        for u, v in zip(ends[0::2], ends[1::2]):
+            appended[u].append(v)
+            appended[v].append(u)
+            if union is not None:
+                union(u, v)
+
+        # Adding a neighbor unless it is already present keeps its first occurrence, as dict.fromkeys does
+        for v in range(first_new):
+            if appended[v]:
+                self.vertices[v] = list(dict.fromkeys(self.vertices[v] + appended[v]))
+        for v in range(first_new, len(labels)):
+            self.vertices[v] = list(dict.fromkeys(appended[v]))
+            # Vertices without coordinates get random ones in creation order, like add_vertex
+            self.coordinates[v] = new_coordinates[v - first_new] if new_coordinates else (random.random(),
+                                                                                           random.random())
+
+    def read_largest_component_from_file(self, file_path, chunk_bytes=1 << 22):
+        """Load only the largest connected component of an edge file, streaming it twice.
+
+        The first pass runs a union-find over the edges, holding the label to id map and two int arrays; the
+        second one builds the adjacency of the component's vertices. The graph is the one read_graph_from_file builds,
+        restricted to the component and renumbered 0..k-1: same vertex order, neighbor order and file
+        coordinates (random coordinates are only drawn for the component). Replaces the contents of the graph.
+
+        The vertex and edge counts of the whole file are kept in original_counts. Edges outside the component are
+        counted line by line, so a repeated one there counts more than once."""
+        track_components = self.components is not None
+        labels, label_ids = [], {}  # Vertex labels in order of first appearance, and their ids
+        components = UnionFind(typecode='i')
+        for chunk_labels, _ in self.edge_chunks(file_path, chunk_bytes):
+            for label in dict.fromkeys(chunk_labels):
+                if label not in label_ids:
+                    label_ids[label] = components.add()
+                    labels.append(label)
+            ends = list(map(label_ids.__getitem__, chunk_labels))
+            union = components.union
+            for u, v in zip(ends[0::2], ends[1::2]):
+                union(u, v)
+
+        # Component ids in the order of the full graph's ids; -1 for the vertices left out
+        members = components.largest_component()
+        vertex_count = len(components.parent)
+        component_id = array('q', [-1]) * vertex_count
+        for i, v in enumerate(members):
+            component_id[v] = i
+        del components
+
+        self.vertices = {}
+        self.coordinates = {}
+        self.dense = True
+        self.components = None
+        self.labels = [labels[v] for v in members]
+        self.label_ids = {label: v for v, label in enumerate(self.labels)}
+        del labels
+        appended = [[] for _ in members]
+        coordinates = [None] * len(members)
+        other_edges = 0  # Edge lines of the other components
+        for chunk_labels, point in self.edge_chunks(file_path, chunk_bytes):
+            ends = list(map(component_id.__getitem__, map(label_ids.__getitem__, chunk_labels)))
+            for u, v in zip(ends[0::2], ends[1::2]):
+                if u >= 0:  # Both ends are in the same component
+                    appended[u].append(v)
+                    appended[v].append(u)
+                else:
+                    other_edges += 1
+            if point is not None:
+                first_position = dict(zip(reversed(ends), range(len(ends) - 1, -1, -1)))
+                for v, position in first_position.items():
+                    if v >= 0 and coordinates[v] is None:
+                        coordinates[v] = point(position)
+
+        for v, neighbors in enumerate(appended):
+            self.vertices[v] = list(dict.fromkeys(neighbors))
+            # Vertices without coordinates get random ones in id order, like add_vertex
+            self.coordinates[v] = coordinates[v] if coordinates[v] is not None else (random.random(), random.random())
+        self.original_counts = (vertex_count, sum(map(len, self.vertices.values())) // 2 + other_edges)
+        if track_components:
+            # The whole graph is the one component
+            self.components = UnionFind(len(members))
+            for v in range(1, len(members)):
+                self.components.union(0, v)
+
 # New method to initialize or reset vertex properties
     def initialize_vertex_properties(self):
         self.vertex_properties = {v: {'color': 'WHITE', 'd': 0, 'f': 0, 'pi': None} for v in self.vertices}
@@ -42,29 +289,73 @@ class Graph:
         """Generate a random geometric graph with n vertices and connection radius r."""
         self.vertices = {}
         self.coordinates = {}
+        self.dense = True
+        self.components = None
+        self.original_counts = None
+        self.labels = list(range(n))
+        self.label_ids = {i: i for i in range(n)}
 
         # Add vertices
         for i in range(n):
             self.add_vertex(i)
 
-        # Add edges
-        for u in self.vertices:
-            for v in self.vertices:
-                if u != v and self.euclidean_distance(self.coordinates[u], self.coordinates[v]) < r:
-                    self.add_edge(u, v)
+        self.connect_within(r)
+
+    def connect_within(self, r):
+        """Replace the edges with those of the geometric graph of radius r over the current coordinates."""
+        for v in self.vertices:
+            self.vertices[v] = []
+        self.components = None
+
+        # Add edges, each pair is reported once by the grid so no duplicate checks are needed
+        for u, v, _ in self.geometric_pairs(r):
+            self.vertices[u].append(v)
+            self.vertices[v].append(u)
+        for neighbors in self.vertices.values():
+            neighbors.sort()
+
+    def geometric_pairs(self, r):
+        """Yield (u, v, distance) for every pair u < v closer than r, using a grid of r-sized cells."""
+        if r <= 0:
+            return
+        cells = {}
+        for v, (x, y) in self.coordinates.items():
+            cells.setdefault((int(x // r), int(y // r)), []).append(v)
+
+        for (cx, cy), members in cells.items():
+            # Pairs inside the cell, then the four forward neighbor cells so each cell pair is visited once
+            for i, u in enumerate(members):
+                for v in members[i + 1:]:
+                    distance = self.euclidean_distance(self.coordinates[u], self.coordinates[v])
+                    if distance < r:
+                        yield (u, v, distance) if u < v else (v, u, distance)
+            for dx, dy in ((1, -1), (1, 0), (1, 1), (0, 1)):
+                others = cells.get((cx + dx, cy + dy))
+                if others is None:
+                    continue
+                for u in members:
+                    for v in others:
+                        distance = self.euclidean_distance(self.coordinates[u], self.coordinates[v])
+                        if distance < r:
+                            yield (u, v, distance) if u < v else (v, u, distance)
 
     def euclidean_distance(self, coord1, coord2):
         """Calculate the Euclidean distance between two coordinates."""
         return math.sqrt((coord1[0] - coord2[0]) ** 2 + (coord1[1] - coord2[1]) ** 2)
 
-    def write_to_file(self, file_path):
+    def write_to_file(self, file_path, chunk_lines=65536):
+        # Format each vertex once and write edge lines in large chunks instead of one write per edge
+        prefixes = {v: f"{self.label(v)} {x} {y}" for v, (x, y) in self.coordinates.items()}
         with open(file_path, 'w') as file:
+            lines = []
             for vertex, edges in self.vertices.items():
-                ux, uy = self.coordinates[vertex]
                 for edge in edges:
                     if vertex < edge:  # Ensure each edge is written only once
-                        vx, vy = self.coordinates[edge]
-                        file.write(f"{vertex} {ux} {uy} {edge} {vx} {vy}\n")
+                        lines.append(f"{prefixes[vertex]} {prefixes[edge]}\n")
+                if len(lines) >= chunk_lines:
+                    file.writelines(lines)
+                    lines.clear()
+            file.writelines(lines)
 
     def read_edges_with_coordinates_from_file(self, file_path):
         with open(file_path, 'r') as file:
@@ -73,6 +364,7 @@ class Graph:
                 parts = line.strip().split()
                 u, (x1, y1), v, (x2, y2) = int(parts[0]), (float(parts[1]), float(parts[2])), int(parts[3]), (
                 float(parts[4]), float(parts[5]))
+                u, v = self.vertex_id(u), self.vertex_id(v)
 
                 # Add vertices with coordinates if they don't already exist
                 if u not in self.vertices:
@@ -85,14 +377,82 @@ class Graph:
 
     def add_vertex_with_coordinates(self, v, coords):
         if v not in self.vertices:
+            self.track_new_vertex(v)
             self.vertices[v] = []
             self.coordinates[v] = coords
 
-    def generate_random_geometric_graph_full(self, n ,r, filename=None):
-        self.generate_random_geometric_graph(n, r)
+    def generate_random_geometric_graph_numpy(self, n, r, block_size=65536):
+        """NumPy version of generate_random_geometric_graph, pairing points of neighboring r-sized cells in blocks."""
+        rng = np.random.default_rng(random.getrandbits(64))  # Seeded from random so random.seed() still applies
+        points = rng.random((n, 2))
+        u, v = self.geometric_pairs_numpy(points, r, block_size)
+        tails = np.concatenate([u, v])
+        heads = np.concatenate([v, u])
+        edge_order = np.lexsort((heads, tails))
+        tails, heads = tails[edge_order], heads[edge_order]
+        neighbor_lists = np.split(heads, np.cumsum(np.bincount(tails, minlength=n))[:-1])
+
+        self.vertices = {i: neighbors.tolist() for i, neighbors in enumerate(neighbor_lists[:n])}
+        self.coordinates = {i: (x, y) for i, (x, y) in enumerate(points.tolist())}
+        self.dense = True
+        self.components = None
+        self.original_counts = None
+        self.labels = list(range(n))
+        self.label_ids = {i: i for i in range(n)}
+
+    def geometric_pairs_numpy(self, points, r, block_size=65536):
+        """Index arrays (u, v) of every pair of the (n, 2) points closer than r, each pair once."""
+        n = len(points)
+        sources, targets = [], []
+        if n > 0 and r > 0:
+            # Sort the points by grid cell so every cell is a contiguous run of the sorted order
+            cells = np.floor(points / r).astype(np.int64) + 1
+            stride = int(cells[:, 1].max()) + 2
+            keys = cells[:, 0] * stride + cells[:, 1]
+            order = np.argsort(keys, kind='stable')
+            sorted_points = points[order]
+            cell_keys, cell_starts, cell_counts = np.unique(keys[order], return_index=True, return_counts=True)
+            point_cell = np.repeat(np.arange(len(cell_keys)), cell_counts)
+
+            for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+                wanted = cell_keys + dx * stride + dy
+                found = np.minimum(np.searchsorted(cell_keys, wanted), len(cell_keys) - 1)
+                found[cell_keys[found] != wanted] = -1
+
+                # Process the points in blocks so the candidate pair arrays stay bounded in memory
+                for start in range(0, n, block_size):
+                    rows = np.arange(start, min(start + block_size, n))
+                    target_cells = found[point_cell[rows]]
+                    rows = rows[target_cells >= 0]
+                    target_cells = target_cells[target_cells >= 0]
+                    counts = cell_counts[target_cells]
+                    total = int(counts.sum())
+                    if total == 0:
+                        continue
+                    first = np.cumsum(counts) - counts
+                    columns = np.repeat(cell_starts[target_cells] - first, counts) + np.arange(total)
+                    rows = np.repeat(rows, counts)
+                    if dx == 0 and dy == 0:
+                        keep = rows < columns
+                        rows, columns = rows[keep], columns[keep]
+                    diff = sorted_points[rows] - sorted_points[columns]
+                    close = np.sqrt((diff ** 2).sum(axis=1)) < r
+                    sources.append(order[rows[close]])
+                    targets.append(order[columns[close]])
+
+        u = np.concatenate(sources) if sources else np.empty(0, dtype=np.int64)
+        v = np.concatenate(targets) if targets else np.empty(0, dtype=np.int64)
+        return u, v
+
+    def generate_random_geometric_graph_full(self, n ,r, filename=None, use_numpy=None):
+        if use_numpy is None:
+            use_numpy = np is not None
+        if use_numpy:
+            self.generate_random_geometric_graph_numpy(n, r)
+        else:
+            self.generate_random_geometric_graph(n, r)
+        # The generated graph already is what reading the file back would give, ids included
         self.write_to_file('Graphs/random_geometric_graph_OUTPUT.edges' if filename is None else filename)
-        self.read_edges_with_coordinates_from_file('Graphs/random_geometric_graph_OUTPUT.edges' if filename is None else
-                                                   filename)
 
 
 
@@ -0,0 +1,109 @@
+import hashlib
+import mmap
+import os
+import struct
+from array import array
+
+from CSRGraph import CSRGraph
+from Graph import Graph
+from UnionFind import UnionFind
+
+
+class GraphCache:
+    """Binary CSR copy of a graph file, stored next to it and keyed on the SHA-256 of the file's contents.
+
+    Layout: an 80-byte header (magic, digest, vertex count, neighbor count, coordinates flag, and the vertex and
+    edge counts of the whole file when only its largest component is kept, -1 otherwise), then the offsets,
+    labels and coordinates as 8-byte values and the neighbors and the connected components (union-find parent
+    and size arrays) as 4-byte values. A valid cache is memory-mapped and the CSRGraph arrays are views
+    into the mapping, so nothing is parsed; only the small component arrays are copied."""
+
+    suffix = '.csr'
+    magic = b'LSPCSR03'
+    header = struct.Struct('=8s32sqqqqq')
+
+    def __init__(self, file_path, largest_component_only=False):
+        self.file_path = file_path
+        # Streams the file twice and keeps only its largest connected component, for files too big to hold
+        self.largest_component_only = largest_component_only
+        self.cache_path = file_path + ('.lcc' if largest_component_only else '') + self.suffix
+        self.hit = False  # True if the last load came from the cache
+        self.content_hash = None  # Hex SHA-256 of the file, set by load; keys the file's results in ResultCache
+
+    def digest(self, chunk_bytes=1 << 20):
+        sha256 = hashlib.sha256()
+        with open(self.file_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(chunk_bytes), b''):
+                sha256.update(chunk)
+        return sha256.digest()
+
+    def load(self):
+        """Return the file's CSRGraph, from the cache when it matches the file, parsing and caching it otherwise."""
+        digest = self.digest()
+        self.content_hash = digest.hex()
+        graph = self.read(digest)
+        self.hit = graph is not None
+        if graph is None:
+            parsed = Graph(track_components=True)  # The components come out of parsing, no extra pass
+            if self.largest_component_only:
+                parsed.read_largest_component_from_file(self.file_path)
+            else:
+                parsed.read_graph_from_file(self.file_path)
+            graph = parsed.compile()
+            self.write(graph, digest)
+        return graph
+
+    def read(self, digest):
+        # None when there is no cache or it was written for other contents
+        try:
+            with open(self.cache_path, 'rb') as file:
+                mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        if len(mapping) < self.header.size:
+            return None
+        magic, cached_digest, n, neighbor_count, has_coordinates, original_vertices, original_edges = \
+            self.header.unpack_from(mapping)
+        if magic != self.magic or cached_digest != digest or n < 0 or neighbor_count < 0:
+            return None
+        # A truncated or partly written file would fail to cast its sections, treat it as no cache
+        expected = self.header.size + 8 * (n + 1) + 8 * n + (16 * n if has_coordinates else 0) + \
+            4 * neighbor_count + 8 * n
+        if len(mapping) != expected:
+            return None
+
+        view = memoryview(mapping)
+        position = self.header.size
+
+        def section(count, code, size):
+            nonlocal position
+            start, position = position, position + count * size
+            return view[start:position].cast(code)
+
+        offsets = section(n + 1, 'q', 8)
+        labels = section(n, 'q', 8)
+        coordinates = section(2 * n, 'd', 8) if has_coordinates else None
+        neighbors = section(neighbor_count, 'i', 4)
+        components = UnionFind.from_arrays(section(n, 'i', 4), section(n, 'i', 4))
+        original_counts = (original_vertices, original_edges) if original_vertices >= 0 else None
+        return CSRGraph(offsets, neighbors, labels, coordinates, components, original_counts)
+
+    def write(self, graph, digest):
+        # Written to a temporary file and renamed, so a reader never maps a half-written cache
+        temporary = self.cache_path + '.tmp'
+        try:
+            with open(temporary, 'wb') as file:
+                original_vertices, original_edges = graph.original_counts or (-1, -1)
+                file.write(self.header.pack(self.magic, digest, graph.n, len(graph.neighbors),
+                                            graph.coordinates is not None, original_vertices, original_edges))
+                file.write(array('q', graph.offsets).tobytes())
+                file.write(array('q', graph.labels).tobytes())
+                if graph.coordinates is not None:
+                    file.write(array('d', graph.coordinates).tobytes())
+                file.write(array('i', graph.neighbors).tobytes())
+                components = graph.connected_components()
+                file.write(array('i', map(components.find, range(graph.n))).tobytes())
+                file.write(array('i', components.size).tobytes())
+            os.replace(temporary, self.cache_path)
+        except OSError:
+            pass  # A read-only directory only costs the next run a parse
@@ -1,16 +1,29 @@
+from Bounds import Bounds
+
+
 class GraphMetrics:
-    def __init__(self, graph, lcc, lsp):
+    def __init__(self, graph, lcc, lsp, bounds=None):
         # graph is an instance of your Graph class
         # lcc is a list of nodes representing the largest connected component
         # lsp is a list of nodes representing the longest simple path
+        # bounds is a Bounds of the same LCC, shared between metrics of several paths
         self.graph = graph
         self.lcc = lcc
         self.lsp = lsp
+        self.bounds = bounds if bounds is not None else Bounds(graph, lcc)
 
     def number_of_nodes(self):
-        # Returns the number of nodes in the graph.
+        # Returns the number of nodes in the graph file, also when only its LCC was loaded.
+        if self.graph.original_counts is not None:
+            return self.graph.original_counts[0]
         return len(self.graph.vertices)
 
+    def number_of_edges(self):
+        # Returns the number of edges in the graph file, also when only its LCC was loaded.
+        if self.graph.original_counts is not None:
+            return self.graph.original_counts[1]
+        return sum(len(self.graph.vertices[node]) for node in self.graph.vertices) // 2
+
     def lcc_size(self):
         # Returns the number of nodes in the largest connected component.
         return len(self.lcc)
@@ -33,15 +46,43 @@ class GraphMetrics:
         # Returns the length of the longest simple path found in the LCC.
         return len(self.lsp) - 1
 
+    def lsp_upper_bound(self):
+        if not self.lcc:
+            return 0
+        # Returns an upper bound on the length of any simple path in the LCC.
+        return self.bounds.upper_bound() - 1
+
+    def optimality_gap(self):
+        if not self.lcc:
+            return 0
+        # Returns how many edges longer than the path found the longest simple path could be.
+        return self.lsp_upper_bound() - self.lsp_length()
+
+    def as_dict(self):
+        # Returns all metrics keyed by plain names, for machine-readable output.
+        return {
+            'n': self.number_of_nodes(),
+            'm': self.number_of_edges(),
+            'lcc_size': self.lcc_size(),
+            'max_degree': self.max_degree(),
+            'average_degree': self.average_degree(),
+            'lsp_length': self.lsp_length(),
+            'lsp_upper_bound': self.lsp_upper_bound(),
+            'optimality_gap': self.optimality_gap(),
+        }
+
     def print_all_metrics(self, metrics_name):
         # Calculate and return all metrics as a dictionary.
         metrics = {
             f'{metrics_name}':'',
             'n': self.number_of_nodes(),
+            'm': self.number_of_edges(),
             '|VLCC|': self.lcc_size(),
             '∆(LCC)': self.max_degree(),
             'k(LCC)': self.average_degree(),
             'Lmax': self.lsp_length(),
+            'Lmax bound': self.lsp_upper_bound(),
+            'gap': self.optimality_gap(),
         }
 
         for metric, value in metrics.items():
@@ -1,21 +1,57 @@
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import random
+import sys
+import time
 
 
 class Grasp:
-    def __init__(self, graph, lcc):
+    def __init__(self, graph, lcc, warnsdorff=False):
         self.graph = graph  # Full graph with vertices and neighbors
         self.lcc = set(lcc)  # Set of vertices in the largest connected component (LCC)
+        self.lcc_list = list(self.lcc)  # Start vertices are drawn from this list
         self.iterations = 20
         self.candidate_list_size = 3
+        # Rank candidates by fewest free neighbors first (Warnsdorff's rule) instead of most LCC neighbors
+        self.warnsdorff = warnsdorff
+        self.rng = random  # Source of the random choices; the seeded driver sets a random.Random per iteration
 
-    def get_candidates(self, current_node, path):
-        # Collect nodes that are not already in the path and are within the LCC to avoid cycles
-        candidates = [
-            node for node in self.graph.vertices[current_node]
-            if node not in path and node in self.lcc
-        ]
-        # Convert neighbors list and LCC list to sets and calculate intersection
-        candidates.sort(key=lambda x: len(set(self.graph.vertices[x]) & self.lcc), reverse=True)
+        # Static index: LCC neighbors and LCC degree of every LCC vertex
+        self.lcc_neighbors = graph.new_vertex_state(())
+        self.lcc_degree = graph.new_vertex_state(0)
+        for v in self.lcc:
+            self.lcc_neighbors[v] = tuple(w for w in graph.vertices[v] if w in self.lcc)
+            self.lcc_degree[v] = len(set(self.lcc_neighbors[v]))
+        # Dynamic index for the path being built: membership and LCC neighbors not on it yet
+        self.in_path = graph.new_vertex_state(False)
+        self.free_degree = list(self.lcc_degree) if isinstance(self.lcc_degree, list) else dict(self.lcc_degree)
+
+    def add_to_path(self, v):
+        self.in_path[v] = True
+        for w in self.lcc_neighbors[v]:
+            self.free_degree[w] -= 1
+
+    def clear_path(self, path):
+        for v in path:
+            self.in_path[v] = False
+            for w in self.lcc_neighbors[v]:
+                self.free_degree[w] += 1
+
+    def warnsdorff_score(self, node):
+        # Fewest onward moves first, but dead ends only when nothing else is left
+        return self.free_degree[node] == 0, self.free_degree[node]
+
+    def candidate_score(self, node):
+        if self.warnsdorff:
+            return self.warnsdorff_score(node)
+        return -self.lcc_degree[node]
+
+    def get_candidates(self, current_node, path, in_path=None):
+        # Collect nodes that are not already in the path and are within the LCC to avoid cycles. The
+        # construction passes its membership state; other callers only have the path list.
+        on_path = set(path).__contains__ if in_path is None else in_path.__getitem__
+        candidates = [node for node in self.lcc_neighbors[current_node] if not on_path(node)]
+        candidates.sort(key=self.candidate_score)
         # Return top candidates based on candidate_list_size
         return candidates[:self.candidate_list_size]
 
@@ -24,35 +60,87 @@ class Grasp:
             return []  # Return an empty path if there are no vertices in the LCC
 
         # Start from a random node in the LCC
-        start_node = random.choice(list(self.lcc))
+        start_node = self.rng.choice(self.lcc_list)
         path = [start_node]
+        self.add_to_path(start_node)
         current_node = start_node
 
         while True:
-            candidates = self.get_candidates(current_node, path)
+            candidates = self.get_candidates(current_node, path, self.in_path)
             if not candidates:
                 break
             # Select one candidate randomly from the candidates list
-            next_node = random.choice(candidates)
+            next_node = self.rng.choice(candidates)
             path.append(next_node)
+            self.add_to_path(next_node)
             current_node = next_node
 
+        self.clear_path(path)
         return path
 
     def local_search(self, path):
-        # Try to improve the path by checking if any node not in the path can be inserted
-        best_path = path
-        for i in range(len(path) - 1):
-            for node in self.lcc:
-                if node not in path:
-                    # Check if inserting the node between any two consecutive nodes in the path is possible
-                    if node in self.graph.vertices[path[i]] and node in self.graph.vertices[path[i + 1]]:
-                        # Create a new path with the node inserted
-                        new_path = path[:i + 1] + [node] + path[i + 1:]
-                        # Check if the new path is simple (no cycles) and longer than the best path
-                        if len(new_path) > len(best_path) and self.verify_simple_path(new_path):
-                            best_path = new_path
-        return best_path
+        # Grow the path to a local optimum: extend both ends, rotate a stuck end (Posa) so it can be extended,
+        # and insert common neighbors between consecutive vertices. Every accepted move adds vertices.
+        path = list(path)
+        if not path:
+            return path
+        for v in path:
+            self.add_to_path(v)
+        while True:
+            self.extend_end(path)
+            path.reverse()
+            self.extend_end(path)
+            if self.rotate_end(path):
+                continue
+            path.reverse()
+            if self.rotate_end(path):
+                continue
+            if not self.insert_common_neighbors(path):
+                break
+        self.clear_path(path)
+        return path
+
+    def extend_end(self, path):
+        # Walk on from the last vertex while it has a free neighbor, fewest onward moves first
+        while True:
+            free = [w for w in self.lcc_neighbors[path[-1]] if not self.in_path[w]]
+            if not free:
+                return
+            next_node = min(free, key=self.warnsdorff_score)
+            path.append(next_node)
+            self.add_to_path(next_node)
+
+    def rotate_end(self, path):
+        # Posa rotation: for an edge from the last vertex back to path[j], reversing path[j + 1:] makes
+        # path[j + 1] the new end; only done when that vertex has a free neighbor to extend to
+        last = path[-1]
+        position = None
+        for w in self.lcc_neighbors[last]:
+            if not self.in_path[w]:
+                continue
+            if position is None:
+                position = {v: i for i, v in enumerate(path)}
+            j = position[w]
+            if j < len(path) - 2 and self.free_degree[path[j + 1]] > 0:
+                path[j + 1:] = path[:j:-1]
+                return True
+        return False
+
+    def insert_common_neighbors(self, path):
+        # One pass placing a free common neighbor of path[i] and path[i + 1] between them
+        new_path = [path[0]]
+        for a, b in zip(path, path[1:]):
+            if self.free_degree[a] > 0 and self.free_degree[b] > 0:
+                b_free = {w for w in self.lcc_neighbors[b] if not self.in_path[w]}
+                for w in self.lcc_neighbors[a]:
+                    if w in b_free and not self.in_path[w]:
+                        new_path.append(w)
+                        self.add_to_path(w)
+                        break
+            new_path.append(b)
+        inserted = len(new_path) > len(path)
+        path[:] = new_path
+        return inserted
 
     def verify_simple_path(self, path):
         # Verify that the path does not contain repeated nodes (no cycles)
@@ -60,18 +148,118 @@ class Grasp:
 
     def grasp_longest_path(self):
         best_path = []
-        for _ in range(self.iterations):
-            path = self.greedy_randomized_construction()
-            path = self.local_search(path)
-
-            # Verify the path is simple before considering it
-            if self.verify_simple_path(path):
-                # Check if the path is entirely within the LCC
-                if set(path).issubset(self.lcc):
-                    if len(path) > len(best_path):
-                        best_path = path
-                else:
-                    # If path is not within LCC, skip it
-                    continue
-
-        return best_path
\ No newline at end of file
+        for best_path in self.incumbents(iterations=self.iterations):
+            pass
+        return best_path
+
+    def incumbents(self, token=None, iterations=None, seed=None):
+        """Yield the longest path so far each time an iteration improves it.
+
+        Runs `iterations` iterations, or until the token expires when no count is given (self.iterations
+        without a token either). With a seed, iteration i draws from its own random.Random as in grasp_parallel."""
+        if iterations is None and token is None:
+            iterations = self.iterations
+        best_path = []
+        iteration = 0
+        try:
+            while iterations is None or iteration < iterations:
+                if token is not None and token.expired():
+                    return
+                if seed is not None:
+                    self.rng = random.Random(f"{seed}:{iteration}")
+                path = self.greedy_randomized_construction()
+                path = self.local_search(path)
+                iteration += 1
+
+                # Verify the path is simple before considering it
+                if self.verify_simple_path(path):
+                    # Check if the path is entirely within the LCC
+                    if set(path).issubset(self.lcc):
+                        if len(path) > len(best_path):
+                            best_path = path
+                            yield path
+                    else:
+                        # If path is not within LCC, skip it
+                        continue
+        finally:
+            self.rng = random
+
+    def run_iterations(self, first, stride, iterations, deadline, seed, upper_bound=None, reached=None):
+        # Iterations first, first + stride, ... below `iterations` (None for no limit) until the deadline or a path
+        # reaches upper_bound vertices (the LCC size by default); each one draws from its own random.Random, so its
+        # result does not depend on which process ran it. `reached` is the shared earliest iteration that reached
+        # the bound, so workers stop before iterations that come after it.
+        if upper_bound is None:
+            upper_bound = len(self.lcc)
+        best_path, best_iteration, stats = [], None, []
+        iteration = first
+        while (iterations is None or iteration < iterations) and (deadline is None or time.time() < deadline):
+            if reached is not None and reached.value < iteration:
+                break  # An earlier iteration already reached the upper bound, no later one can replace it
+            start = time.time()
+            self.rng = random.Random(f"{seed}:{iteration}")
+            constructed = self.greedy_randomized_construction()
+            path = self.local_search(constructed)
+            stats.append({'iteration': iteration, 'construction': len(constructed), 'local_search': len(path),
+                          'seconds': time.time() - start})
+            if len(path) > len(best_path):
+                best_path, best_iteration = path, iteration
+                if len(path) >= upper_bound:
+                    if reached is not None:
+                        with reached.get_lock():
+                            reached.value = min(reached.value, iteration)
+                    break  # No later iteration can find a longer path
+            iteration += stride
+        self.rng = random
+        return best_path, best_iteration, stats
+
+    def grasp_parallel(self, iterations=None, time_limit=None, workers=1, seed=0, upper_bound=None):
+        """Return (best path, per-iteration statistics) of seeded GRASP iterations spread over processes.
+
+        Runs `iterations` iterations, or as many as fit in `time_limit` seconds, or whichever ends first when
+        both are given, and stops early once a path reaches upper_bound vertices (the LCC size by default). The
+        same seed and iteration count give the same path for any number of workers."""
+        if iterations is None and time_limit is None:
+            iterations = self.iterations
+        if upper_bound is None:
+            upper_bound = len(self.lcc)
+        deadline = None if time_limit is None else time.time() + time_limit
+        if workers > 1:
+            reached = multiprocessing.Value('q', sys.maxsize)
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_grasp_worker,
+                                     initargs=(self.graph, self.lcc_list, self.warnsdorff, self.iterations,
+                                               self.candidate_list_size, reached)) as executor:
+                results = list(executor.map(_grasp_iterations, [(first, workers, iterations, deadline, seed,
+                                                                  upper_bound) for first in range(workers)]))
+        else:
+            results = [self.run_iterations(0, 1, iterations, deadline, seed, upper_bound)]
+
+        # Longest path first, ties to the earliest iteration as in the serial loop
+        found = [(path, iteration) for path, iteration, _ in results if iteration is not None]
+        best_path, best_iteration = max(found, key=lambda result: (len(result[0]), -result[1]), default=([], None))
+        stats = sorted((stat for _, _, worker_stats in results for stat in worker_stats),
+                       key=lambda stat: stat['iteration'])
+        if len(best_path) >= upper_bound:
+            # The serial loop stops at the first iteration reaching the bound; drop what other workers ran after it
+            stats = [stat for stat in stats if stat['iteration'] <= best_iteration]
+        return best_path, stats
+
+
+_worker_grasp = None
+
+
+_worker_reached = None
+
+
+def _init_grasp_worker(graph, lcc_list, warnsdorff, iterations, candidate_list_size, reached):
+    global _worker_grasp, _worker_reached
+    _worker_grasp = Grasp(graph, lcc_list, warnsdorff)
+    _worker_grasp.lcc_list = lcc_list  # Same start order as the parent, whatever order the set iterates in
+    # The parent's settings, so the workers run the same iterations as the serial loop would
+    _worker_grasp.iterations = iterations
+    _worker_grasp.candidate_list_size = candidate_list_size
+    _worker_reached = reached
+
+
+def _grasp_iterations(task):
+    return _worker_grasp.run_iterations(*task, reached=_worker_reached)
@@ -1,19 +1,49 @@
+import argparse
+import csv
+from concurrent.futures import ProcessPoolExecutor
+import glob
+import json
 import os
-from time import time
 import sys
+from time import time
+from Anytime import CancellationToken, solve_anytime
+from BitmaskDP import BitmaskDP
+from BlockCutTree import BlockCutTree
+from BranchAndBound import BranchAndBound
+from Bounds import Bounds
 from DFS import DFS
 from DijkstraMax import DijkstraMax
 from Grasp import Grasp
 from Spinner import Spinner
 from aStar import aStar
+from GraphCache import GraphCache
 from GraphMetrics import GraphMetrics
 from Graph import Graph
+from Portfolio import Portfolio
+from Reduction import Reduction
+from ResultCache import ResultCache
+from UnionFind import UnionFind
 from math import sqrt
 import threading
 
-sys.setrecursionlimit(1500)
-
 spinner = Spinner()
+workers = os.cpu_count() or 1  # Processes used by the parallel solvers
+exact_time_limit = 30  # Seconds the exact solvers may run before returning their best path
+astar_pair_budget = 1000  # Endpoint pairs searched by the pruned A* on the online graphs
+astar_time_limit = 60  # Seconds before A* stops and reports the best path found so far
+grasp_time_limit = 10  # Seconds of GRASP iterations across the worker processes
+portfolio_mode = False  # Run the solvers concurrently with portfolio_test instead of one after another
+portfolio_time_limit = 60  # Seconds before the portfolio stops its solvers
+stream_lcc_bytes = 1 << 30  # Files larger than this are streamed twice, keeping only their largest component
+use_result_cache = True  # Reuse stored solver results for graph files whose contents have not changed
+result_cache_path = "lsp_results.sqlite"
+result_cache_entries = 1000  # Results kept before the least recently used ones are evicted
+online_files = {"Graphs/DSJC500-5.mtx", "Graphs/inf-euroroad.edges", "Graphs/inf-power.mtx"}
+batch_solvers = ("DijkstraMax", "DFS", "A*", "GRASP", "Branch and Bound", "Exact")  # Solvers run_job knows
+# Part of the result cache key: bump a solver's version when a change to it can change the paths it returns, so
+# results stored by the old code are not reused
+solver_versions = {"DijkstraMax": "1", "DFS": "1", "A*": "1", "GRASP": "1", "Bitmask DP": "1",
+                   "Block-cut Tree": "1", "Reduced Search": "1"}
 def binary_search(n, interval, filename: str):
 
     g = Graph()
@@ -23,9 +53,7 @@ def binary_search(n, interval, filename: str):
     while right - left > 1e-6:  # Binary search tolerance
         r = (left + right) / 2
         g.generate_random_geometric_graph_full(n, r, filename)
-        dfs = DFS(graph=g)
-        lcc = dfs.DFS_LCC()  # Returns the list of nodes in the LCC
-        VLCC = len(lcc)
+        VLCC = g.connected_components().largest  # Size of the LCC from the union-find
 
         if interval[0] * n <= VLCC <= interval[1] * n:
             success = True
@@ -39,112 +67,412 @@ def binary_search(n, interval, filename: str):
         print("Failed to generate graph that satisfies the VLCC condition")
 
 
-def create_random_graphs():
+def radius_sweep(n, interval, filename: str, point_sets=20):
+    """Fix a point set and find the radius for the VLCC interval in a single union-find sweep.
+
+    If one step of the sweep merges past the interval, the point set cannot reach it and a new one is drawn,
+    as binary_search does for every radius, giving up after point_sets of them."""
+
+    g = Graph()
+    low, high = interval[0] * n, interval[1] * n
+    r = None
+
+    for _ in range(point_sets):
+        g.generate_random_geometric_graph(n, 0)  # Random points, no edges yet
+        cap = min(2 / sqrt(n), sqrt(2)) if n > 0 else sqrt(2)  # Only pairs closer than cap are candidates
+
+        while r is None:
+            pairs = sorted(g.geometric_pairs(cap), key=lambda pair: pair[2])
+            components = UnionFind(n)
+            if low <= components.largest <= high:
+                r = (pairs[0][2] if pairs else cap) / 2
+
+            i = 0
+            while r is None and i < len(pairs) and components.largest <= high:
+                # Add every edge of the same length together, the graph uses strict distance < r
+                distance = pairs[i][2]
+                while i < len(pairs) and pairs[i][2] == distance:
+                    components.union(pairs[i][0], pairs[i][1])
+                    i += 1
+                if low <= components.largest <= high:
+                    r = (distance + (pairs[i][2] if i < len(pairs) else cap)) / 2
+
+            if r is None:
+                if components.largest > high or cap >= sqrt(2):
+                    break  # This point set skips over the interval, draw another one
+                cap = min(cap * 2, sqrt(2))  # Not enough candidate edges yet, widen the search
+        if r is not None:
+            break
+
+    if r is None:
+        print(f"Failed to generate graph that satisfies the VLCC condition, gave up after {point_sets} point sets")
+        return
+
+    g.connect_within(r)
+    g.write_to_file(filename)
+    print(f"Graph with n={n}, r={r:.4f}, VLCC={components.largest:.4f}")
+
+
+def create_random_graphs(search=radius_sweep):
     conditions = [(300, [0.9, 0.95]), (400, [0.8, 0.9]), (500, [0.7, 0.8])]
     file_name = ["random_geometric_graph_OUTPUT_1.edges", "random_geometric_graph_OUTPUT_2.edges",
                  "random_geometric_graph_OUTPUT_3.edges"]
     for i, (n, interval) in enumerate(conditions):
-        binary_search(n, interval, file_name[i])
+        search(n, interval, file_name[i])
+
+
+def cached_solve(g, results, graph_hash, solver, params, solve, deterministic=True):
+    """Return (path, seconds, optimal, details, cached) of a solver, from the result cache when it may be reused.
+
+    solve() returns (path, optimal, details); it is timed and its result stored. A stored result is only reused
+    when the solver is deterministic or the result was proven optimal: the results of time-limited solvers
+    depend on the machine and its load, so they are kept only as warm incumbents (ResultCache.best_path), and
+    only when they are at least as long as the stored one. The solver's entry of solver_versions is part of the
+    key."""
+    params = dict(params, version=solver_versions.get(solver))
+    cached = results.get(graph_hash, solver, params) if results is not None and graph_hash is not None else None
+    if cached is not None and (deterministic or cached['optimal']):
+        print(f"{solver}: cached result from a previous run")
+        return [g.index_of(label) for label in cached['path']], cached['seconds'], cached['optimal'], \
+            cached['details'], True
+    start = time()
+    path, optimal, details = solve()
+    seconds = time() - start
+    if results is not None and graph_hash is not None and (cached is None or len(path) >= len(cached['path'])):
+        results.put(graph_hash, solver, params, g.to_labels(path), len(path), seconds, optimal, details)
+    return path, seconds, optimal, details, False
+
+
+def cached_note(cached):
+    # Marks the timings of the results table that were measured in a previous run
+    return " (cached time)" if cached else ""
+
+
+def exact_solver(lcc, block_cut_tree):
+    """Name of the exact solver used for this LCC: subset DP for small components, block-cut tree decomposition
+    when the LCC has articulation points, otherwise a search over the LCC with its degree-2 chains contracted
+    into weighted edges."""
+    if len(lcc) <= BitmaskDP.max_vertices:
+        return "Bitmask DP"
+    if len(block_cut_tree.blocks) > 1:
+        return "Block-cut Tree"
+    return "Reduced Search"
+
+
+def solve_exact(g, lcc, block_cut_tree, incumbent, upper_bound, time_limit, workers=1):
+    """Return (path, proven_optimal) of the exact solver picked by exact_solver.
+
+    The incumbent (a known simple path of the LCC) seeds the searches that can be cut short by the time limit.
+    The subset DP has no time limit and always finishes with an optimum, so it does not use it."""
+    name = exact_solver(lcc, block_cut_tree)
+    if name == "Bitmask DP":
+        return BitmaskDP(g, lcc).find_longest_path()[1], True
+    if name == "Block-cut Tree":
+        # Solve each biconnected block on its own and stitch the block paths along the block-cut tree; the time
+        # limit covers all the blocks together
+        return block_cut_tree.find_longest_path(workers=workers, block_time_limit=None, time_limit=time_limit,
+                                                incumbent=incumbent)[1:]
+    reduction = Reduction(g, lcc, incumbent=incumbent, upper_bound=upper_bound)
+    return reduction.find_longest_path(time_limit=time_limit)[1:]
 
 
 def lsp_test(file: str = None):
 
     print(file)
-    # Initialize the graph and read edges from file
-    g = Graph()
-    try:
-        g.read_edges_with_coordinates_from_file(file) if file is not None else g.generate_random_geometric_graph_full(
-            100,
-            0.1)
-    except IndexError:
-        g.read_edges_from_file(file)
+    # Solvers iterate neighbors from frozen CSR arrays: mapped from the binary cache next to the file when it
+    # matches the file's contents, otherwise parsed (any of the edge formats) and cached for the next run
+    start_load = time()
+    graph_hash = None  # Content hash keying the file's stored results; generated graphs are not stored
+    if file is not None:
+        graph_cache = GraphCache(file, largest_component_only=os.path.getsize(file) > stream_lcc_bytes)
+        g = graph_cache.load()
+        graph_hash = graph_cache.content_hash
+    else:
+        g = Graph()
+        g.generate_random_geometric_graph_full(100, 0.1)
+        g = g.compile()
+    end_load = time()
+    results = ResultCache(result_cache_path, result_cache_entries) if use_result_cache else None
 
-    # LCC (DFS_LCC)
-    dfs = DFS(g)
+    # LCC members from the union-find kept while parsing (and stored in the graph cache); only the generated
+    # graph needs a union-find pass over its edges here
     start_lcc = time()
-    lcc = dfs.DFS_LCC()
+    lcc = g.largest_component()
     end_lcc = time()
-    print("Largest Connected Component:", lcc)
+    print("Component sizes (size: count):", g.component_size_histogram())
+    dfs = DFS(g)
+    print("Largest Connected Component:", g.to_labels(lcc))
 
+    # Upper bound on the path vertex count, lets the solvers stop as soon as a path reaches it
+    start_bounds = time()
+    block_cut_tree = BlockCutTree(g, lcc)
+    bounds = Bounds(g, lcc, block_cut_tree)
+    upper_bound = bounds.upper_bound()
+    end_bounds = time()
+    print("Longest Simple Path Upper Bound:", upper_bound - 1)
 
     spinner.start()
 
     # DijkstraMax
-    dijkstra = DijkstraMax(g, lcc)
-    start_dijkstra = time()
-    dijkstra_length, dijkstra_path = dijkstra.get_longest_path()
-    end_dijkstra = time()
+    dijkstra = DijkstraMax(g, lcc, workers=workers)
+
+    def run_dijkstra():
+        return dijkstra.get_longest_path(upper_bound=upper_bound)[1], False, {}
+
+    dijkstra_path, dijkstra_seconds, _, _, dijkstra_cached = cached_solve(g, results, graph_hash, "DijkstraMax",
+                                                                          {}, run_dijkstra)
+    dijkstra_length = max(len(dijkstra_path) - 1, 0)
     print("Dijkstra's Longest Simple Path Length:", dijkstra_length)
-    print("Dijkstra's Longest Simple Path:", dijkstra_path)
+    print("Dijkstra's Longest Simple Path:", g.to_labels(dijkstra_path))
 
     # DFS
-    start_dfs = time()
-    dfs_lsp_length, dfs_lsp_path = dfs.find_lsp()
-    end_dfs = time()
+    def run_dfs():
+        return dfs.find_lsp(lcc, workers=workers, upper_bound=upper_bound)[1], False, {}
+
+    dfs_lsp_path, dfs_seconds, _, _, dfs_cached = cached_solve(g, results, graph_hash, "DFS", {}, run_dfs)
+    dfs_lsp_length = len(dfs_lsp_path) - 1
     print("DFS Longest Simple Path Length:", dfs_lsp_length)
-    print("DFS Longest Simple Path:", dfs_lsp_path)
+    print("DFS Longest Simple Path:", g.to_labels(dfs_lsp_path))
 
-    # A*
-    invalid_files = {"Graphs/DSJC500-5.mtx", "Graphs/inf-euroroad.edges", "Graphs/inf-power.mtx"} # Don't run astar for online graphs
-    if file not in invalid_files:
+    # A*: every pair of endpoints on the generated graphs, a budget of periphery pairs on the online graphs
+    astar = aStar(g, lcc)
+    pair_budget = astar_pair_budget if file in online_files else None
+    pairs = astar.pruned_pairs(max_pairs=pair_budget) if pair_budget is not None else None
+    def run_astar():
+        path = solve_anytime(astar.incumbents(CancellationToken(astar_time_limit), pairs), upper_bound=upper_bound)
+        return path, False, {}
 
-        astar = aStar(g, lcc)
-        start_astar = time()
-        astar_length, astar_lsp_path = astar.find_longest_simple_path()
-        end_astar = time()
-        print("A* Longest Simple Path Length:", len(astar_lsp_path))
-        print("A* Longest Simple Path:", astar_lsp_path)
+    # Time-limited, so a stored path only seeds the exact solver instead of replacing this run
+    astar_lsp_path, astar_seconds, _, _, astar_cached = cached_solve(
+        g, results, graph_hash, "A*", {'pairs': pair_budget, 'time_limit': astar_time_limit}, run_astar,
+        deterministic=astar_time_limit is None)
+    print("A* Longest Simple Path Length:", len(astar_lsp_path))
+    print("A* Longest Simple Path:", g.to_labels(astar_lsp_path))
 
     # GRASP
     grasp = Grasp(g, lcc)
-    start_grasp = time()
-    grasp_lsp_path = grasp.grasp_longest_path()
-    end_grasp = time()
+
+    def run_grasp():
+        path, stats = grasp.grasp_parallel(time_limit=grasp_time_limit, workers=workers, seed=0,
+                                           upper_bound=upper_bound)
+        return path, False, {'iterations': len(stats),
+                             'mean': sum(stat['local_search'] for stat in stats) / max(1, len(stats))}
+
+    grasp_params = {'time_limit': grasp_time_limit, 'workers': workers, 'seed': 0,
+                    'iterations': grasp.iterations, 'candidate_list_size': grasp.candidate_list_size}
+    grasp_lsp_path, grasp_seconds, _, grasp_details, grasp_cached = cached_solve(
+        g, results, graph_hash, "GRASP", grasp_params, run_grasp, deterministic=grasp_time_limit is None)
+    print(f"GRASP iterations: {grasp_details['iterations']}, mean path length:", grasp_details['mean'])
     print("GRASP Longest Simple Path Length:", len(grasp_lsp_path))
-    print("GRASP Longest Simple Path:", grasp_lsp_path)
+    print("GRASP Longest Simple Path:", g.to_labels(grasp_lsp_path))
 
-    # Print the table with results
+    # Exact solver, seeded with the longest of the DijkstraMax/GRASP paths and any path stored for this graph
+    exact_name = exact_solver(lcc, block_cut_tree)
+    warm_labels = results.best_path(graph_hash) if results is not None and graph_hash is not None else []
+    lcc_labels = set(g.to_labels(lcc))
+    warm_path = [g.index_of(label) for label in warm_labels] if lcc_labels.issuperset(warm_labels) else []
+    incumbent = max([dijkstra_path, grasp_lsp_path, warm_path], key=len)
+
+    def run_exact():
+        return solve_exact(g, lcc, block_cut_tree, incumbent, upper_bound, exact_time_limit, workers) + ({},)
+
+    # Only a proven optimum is reused; a path cut short by the time limit seeds the next run instead
+    bnb_path, bnb_seconds, bnb_optimal, _, bnb_cached = cached_solve(
+        g, results, graph_hash, exact_name, {'time_limit': exact_time_limit}, run_exact, deterministic=False)
+    bnb_length = len(bnb_path) - 1
+    if results is not None:
+        results.close()
+    print(f"{exact_name} Longest Simple Path Length:", bnb_length, "(optimal)" if bnb_optimal else "(time limit)")
+    print(f"{exact_name} Longest Simple Path:", g.to_labels(bnb_path))
+
+    # Print the table with results; the vertex count is the file's, also when only its LCC was loaded
+    lcc_metrics = GraphMetrics(g, lcc, [], bounds=bounds)
     print("\nHeuristic\t\tTime (s)\tLongest Path Length")
     print("===============================================")
-    print(f"LCC (DFS_LCC)\t{end_lcc - start_lcc:.6f}\t{len(lcc)} -> vertices count")
-    print(f"Dijkstra's\t\t{end_dijkstra - start_dijkstra:.6f}\t{dijkstra_length} -> edges count")
-    print(f"DFS\t\t\t\t{end_dfs - start_dfs:.6f}\t{dfs_lsp_length} -> edges count")
-    if file not in invalid_files:
-        print(f"A*\t\t\t\t{end_astar - start_astar:.6f}\t{len(astar_lsp_path)} -> vertices count")
-    print(f"GRASP\t\t\t{end_grasp - start_grasp:.6f}\t{len(grasp_lsp_path)} -> vertices count")
+    print(f"Load\t\t\t{end_load - start_load:.6f}\t{lcc_metrics.number_of_nodes()} -> vertices count")
+    print(f"LCC (UnionFind)\t{end_lcc - start_lcc:.6f}\t{len(lcc)} -> vertices count")
+    print(f"Upper Bound\t\t{end_bounds - start_bounds:.6f}\t{upper_bound - 1} -> edges count")
+    print(f"Dijkstra's\t\t{dijkstra_seconds:.6f}\t{dijkstra_length} -> edges count{cached_note(dijkstra_cached)}")
+    print(f"DFS\t\t\t\t{dfs_seconds:.6f}\t{dfs_lsp_length} -> edges count{cached_note(dfs_cached)}")
+    print(f"A*\t\t\t\t{astar_seconds:.6f}\t{len(astar_lsp_path)} -> vertices count{cached_note(astar_cached)}")
+    print(f"GRASP\t\t\t{grasp_seconds:.6f}\t{len(grasp_lsp_path)} -> vertices count{cached_note(grasp_cached)}")
+    print(f"Exact\t\t\t{bnb_seconds:.6f}\t{bnb_length} -> edges count{cached_note(bnb_cached)}")
     print("===============================================")
 
     # Calculate and print metrics for each method
     print("\nMetrics:")
     print("===============================================")
-    # Metrics for LCC (DFS_LCC)
-    lcc_metrics = GraphMetrics(g, lcc, [])
+    # Metrics for LCC (UnionFind)
     lcc_metrics_results = lcc_metrics.print_all_metrics("LCC Metrics")
     print(lcc_metrics_results)
     print("===============================================")
     # Metrics for DijkstraMax
-    dijkstra_metrics = GraphMetrics(g, lcc, dijkstra_path)
+    dijkstra_metrics = GraphMetrics(g, lcc, dijkstra_path, bounds=bounds)
     dijkstra_metrics_results = dijkstra_metrics.print_all_metrics("DijkstraMax Metrics")
     print(dijkstra_metrics_results)
     print("===============================================")
     # Metrics for DFS
-    dfs_metrics = GraphMetrics(g, lcc, dfs_lsp_path)
+    dfs_metrics = GraphMetrics(g, lcc, dfs_lsp_path, bounds=bounds)
     dfs_metrics_results = dfs_metrics.print_all_metrics("DFS Metrics")
     # print(dfs_metrics_results)
     print("===============================================")
     # Metrics for A*
-    if file not in invalid_files:
-        astar_metrics = GraphMetrics(g, lcc, astar_lsp_path)
-        astar_metrics_results = astar_metrics.print_all_metrics("A* Metrics")
-        print(astar_metrics_results)
-        print("===============================================")
+    astar_metrics = GraphMetrics(g, lcc, astar_lsp_path, bounds=bounds)
+    astar_metrics_results = astar_metrics.print_all_metrics("A* Metrics")
+    print(astar_metrics_results)
+    print("===============================================")
     # Metrics for GRASP
-    grasp_metrics = GraphMetrics(g, lcc, grasp_lsp_path)
+    grasp_metrics = GraphMetrics(g, lcc, grasp_lsp_path, bounds=bounds)
     grasp_metrics_results = grasp_metrics.print_all_metrics("GRASP Metrics")
     print(grasp_metrics_results)
+    print("===============================================")
+    # Metrics for the exact solver
+    bnb_metrics = GraphMetrics(g, lcc, bnb_path, bounds=bounds)
+    bnb_metrics_results = bnb_metrics.print_all_metrics(f"{exact_name} Metrics")
+    print(bnb_metrics_results)
     spinner.stop()
 
 
+def portfolio_test(file: str):
+    """Run the solvers concurrently on one graph, sharing the best length, and report the best path found."""
+
+    print(file)
+    g = GraphCache(file, largest_component_only=os.path.getsize(file) > stream_lcc_bytes).load()
+    lcc = g.largest_component()
+
+    spinner.start()
+    portfolio = Portfolio(g, lcc, time_limit=portfolio_time_limit,
+                          astar_pair_budget=astar_pair_budget if file in online_files else None)
+    length, path, solver, proven = portfolio.run()
+    spinner.stop()
+
+    print("\nSeconds\t\tSolver\t\t\tVertices")
+    print("===============================================")
+    for seconds, name, vertices in portfolio.history:
+        print(f"{seconds:.6f}\t{name:<16}\t{vertices}")
+    print("===============================================")
+    print(f"Portfolio Longest Simple Path Length: {length} ({solver})", "(optimal)" if proven else "(time limit)")
+    print("Portfolio Longest Simple Path:", g.to_labels(path))
+    GraphMetrics(g, lcc, path).print_all_metrics("Portfolio Metrics")
+
+
+def run_job(job):
+    """Run one (file, solver, time limit) batch job in a worker process and return its output row.
+
+    The time limit covers the whole job, also when the exact solver splits it into blocks. It is honored
+    between units of work (a start vertex, a source, an endpoint pair, an iteration or a batch of search
+    nodes), so a job can overrun it by one unit."""
+    file, solver, time_limit = job
+    g = GraphCache(file, largest_component_only=os.path.getsize(file) > stream_lcc_bytes).load()
+    lcc = g.largest_component()
+    block_cut_tree = BlockCutTree(g, lcc)
+    bounds = Bounds(g, lcc, block_cut_tree)
+    upper_bound = bounds.upper_bound()
+    token = CancellationToken(time_limit)
+    optimal = False
+
+    start = time()
+    if solver == "DijkstraMax":
+        path = solve_anytime(DijkstraMax(g, lcc).incumbents(token, upper_bound), upper_bound=upper_bound)
+    elif solver == "DFS":
+        path = solve_anytime(DFS(g).incumbents(lcc, token, upper_bound), upper_bound=upper_bound)
+    elif solver == "A*":
+        astar = aStar(g, lcc)
+        pairs = astar.pruned_pairs(max_pairs=astar_pair_budget) if file in online_files else None
+        path = solve_anytime(astar.incumbents(token, pairs), upper_bound=upper_bound)
+    elif solver == "GRASP":
+        grasp = Grasp(g, lcc)
+        iterations = grasp.iterations if time_limit is None else None  # Otherwise iterate until the time limit
+        path = solve_anytime(grasp.incumbents(token, iterations, seed=0), upper_bound=upper_bound)
+    elif solver == "Branch and Bound":
+        _, path, optimal = BranchAndBound(g, lcc, time_limit=time_limit, upper_bound=upper_bound).find_longest_path()
+    elif solver == "Exact":
+        solver = exact_solver(lcc, block_cut_tree)
+        path, optimal = solve_exact(g, lcc, block_cut_tree, [], upper_bound, time_limit)
+    else:
+        raise ValueError(f"Unknown solver: {solver}")
+    seconds = time() - start
+
+    row = {'file': file, 'solver': solver, 'length': len(path) - 1, 'seconds': seconds,
+           'optimal': optimal or len(path) >= upper_bound}
+    row.update(GraphMetrics(g, lcc, path, bounds=bounds).as_dict())
+    row['path'] = g.to_labels(path)
+    return row
+
+
+def batch(files, solvers, time_limits, processes=workers, output_format="json", output=None):
+    """Run every (file, solver) job across a process pool and write one JSON line or CSV row per job.
+
+    time_limits maps a solver to its seconds (None for no limit). Rows are written in job order."""
+    for file in files:
+        GraphCache(file, largest_component_only=os.path.getsize(file) > stream_lcc_bytes).load()  # Cache once
+    jobs = [(file, solver, time_limits.get(solver)) for file in files for solver in solvers]
+    stream = open(output, 'w', newline='') if output is not None else sys.stdout
+    writer = None
+    try:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            for row in executor.map(run_job, jobs):
+                if output_format == "csv":
+                    row['path'] = json.dumps(row['path'])
+                    if writer is None:
+                        writer = csv.DictWriter(stream, fieldnames=list(row))
+                        writer.writeheader()
+                    writer.writerow(row)
+                else:
+                    stream.write(json.dumps(row) + "\n")
+                stream.flush()
+    finally:
+        if output is not None:
+            stream.close()
+
+
+def time_limit_argument(text):
+    """Seconds of a --timeout value; 'none' or 0 mean no limit (None)."""
+    if text.strip().lower() == "none":
+        return None
+    try:
+        seconds = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected seconds or 'none', got {text!r}") from None
+    if not seconds >= 0:
+        raise argparse.ArgumentTypeError(f"expected seconds or 'none', got {text!r}")
+    return seconds or None
+
+
+def parse_arguments(argv):
+    parser = argparse.ArgumentParser(description="Run longest simple path solvers on graph files in batch.")
+    parser.add_argument("files", nargs="+", help="graph files or glob patterns, e.g. 'Graphs/*.mtx'")
+    parser.add_argument("--solvers", nargs="+", choices=batch_solvers, default=list(batch_solvers))
+    parser.add_argument("--timeout", type=time_limit_argument, default=60,
+                        help="seconds per job, 'none' or 0 for no limit (default: 60)")
+    parser.add_argument("--solver-timeout", action="append", default=[], metavar="SOLVER=SECONDS",
+                        help="time limit of one solver, overriding --timeout; can be repeated")
+    parser.add_argument("--processes", type=int, default=workers, help="worker processes (default: CPU count)")
+    parser.add_argument("--format", choices=("json", "csv"), default="json", help="JSON lines or CSV rows")
+    parser.add_argument("--output", help="file to write the rows to (default: standard output)")
+    arguments = parser.parse_args(argv)
+
+    files = []
+    for pattern in arguments.files:
+        matches = sorted(glob.glob(pattern))
+        if not matches and not os.path.isfile(pattern):
+            parser.error(f"no graph file matches {pattern}")
+        files.extend(f for f in matches or [pattern]
+                     if not f.endswith((GraphCache.suffix, GraphCache.suffix + '.tmp')) and f not in files)
+    time_limits = dict.fromkeys(arguments.solvers, arguments.timeout)
+    for setting in arguments.solver_timeout:
+        solver, separator, seconds = setting.rpartition("=")
+        if not separator:
+            parser.error(f"--solver-timeout {setting} is not of the form SOLVER=SECONDS")
+        if solver not in batch_solvers:
+            parser.error(f"unknown solver in --solver-timeout {setting}")
+        try:
+            time_limits[solver] = time_limit_argument(seconds)
+        except argparse.ArgumentTypeError as error:
+            parser.error(f"--solver-timeout {setting}: {error}")
+    return files, arguments, time_limits
+
+
 def list_files(directory):
     """List all files in a directory."""
     return [f for f in os.listdir(directory) if os.path.isfile(os.path.join(directory, f))]
@@ -152,7 +480,7 @@ def list_files(directory):
 
 def select_file():
     directory = "Graphs"  # Set your directory
-    files = list_files(directory)
+    files = [f for f in list_files(directory) if not f.endswith((GraphCache.suffix, GraphCache.suffix + '.tmp'))]
 
     if not files:
         print("No files found.")
@@ -173,7 +501,12 @@ def select_file():
             print("Invalid input. Please enter a number.")
 
 
-if __name__ == "__main__":
+if __name__ == "__main__" and len(sys.argv) > 1:
+    # Batch mode, e.g. python Main.py 'Graphs/*.mtx' --solvers DFS GRASP --solver-timeout GRASP=10 --format csv
+    batch_files, batch_arguments, batch_time_limits = parse_arguments(sys.argv[1:])
+    batch(batch_files, batch_arguments.solvers, batch_time_limits, batch_arguments.processes,
+          batch_arguments.format, batch_arguments.output)
+elif __name__ == "__main__":
     while True:
         spinner.stop()
         print("===============================================")
@@ -181,4 +514,4 @@ if __name__ == "__main__":
         if file_name is None:
             break
         file_path = f"Graphs/{file_name}"
-        lsp_test(file_path)
+        portfolio_test(file_path) if portfolio_mode else lsp_test(file_path)
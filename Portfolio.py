@@ -0,0 +1,110 @@
+from multiprocessing import Event, Process, Queue, Value
+import queue
+import time
+
+from Anytime import CancellationToken, solve_anytime
+from Bounds import Bounds
+from BranchAndBound import BranchAndBound
+from DFS import DFS
+from DijkstraMax import DijkstraMax
+from Grasp import Grasp
+from aStar import aStar
+
+
+class Portfolio:
+    """Runs several solvers at once in separate processes, sharing the best path length found by any of them."""
+
+    all_solvers = ("DijkstraMax", "DFS", "A*", "GRASP", "Branch and Bound")
+
+    def __init__(self, graph, lcc, time_limit=60, upper_bound=None, solvers=all_solvers, astar_pair_budget=None,
+                 seed=0):
+        self.graph = graph
+        self.lcc = lcc
+        self.time_limit = time_limit  # Seconds before every solver is asked to stop
+        # Most vertices any path can have
+        self.upper_bound = Bounds(graph, lcc).upper_bound() if upper_bound is None else upper_bound
+        self.solvers = list(solvers)
+        self.astar_pair_budget = astar_pair_budget  # Pruned A* endpoint pairs, None searches all pairs
+        self.seed = seed  # GRASP seed
+        self.grace_period = 5  # Seconds a solver may take to finish its current step after being stopped
+        self.history = []  # (seconds since the start, solver, vertex count) of every improvement
+        self.finished = {}  # Solver -> True if it proved its result optimal, for the solvers that returned
+
+    def run(self):
+        """Return (length in edges, path, solver that found it, proven_optimal)."""
+        best = Value('q', 0)  # Vertex count of the best path so far, read by Branch and Bound to prune
+        stop = Event()
+        messages = Queue()
+        start = time.time()
+        deadline = start + self.time_limit
+        processes = [Process(target=_run_solver, daemon=True,
+                             args=(name, self.graph, self.lcc, best, stop, messages, deadline, self.upper_bound,
+                                   self.astar_pair_budget, self.seed))
+                     for name in self.solvers]
+        for process in processes:
+            process.start()
+
+        best_path, best_solver, proven = [], None, False
+        while len(self.finished) < len(processes) and time.time() < deadline + self.grace_period:
+            try:
+                kind, name, value = messages.get(timeout=0.1)
+            except queue.Empty:
+                if time.time() > deadline:
+                    stop.set()
+                continue
+            if kind == 'incumbent':
+                if len(value) > len(best_path):
+                    best_path, best_solver = value, name
+                    self.history.append((time.time() - start, name, len(value)))
+                if len(best_path) >= self.upper_bound:
+                    proven = True  # Matches the upper bound, nothing can be longer
+                    stop.set()
+            else:
+                self.finished[name] = value
+                if value:
+                    proven = True  # An exact solver proved that nothing beats the best shared length
+                    stop.set()
+
+        stop.set()
+        for process in processes:
+            process.join(timeout=0.1)
+            if process.is_alive():
+                process.terminate()  # Did not honor the stop within the grace period
+        return len(best_path) - 1, best_path, best_solver, proven
+
+
+def _incumbents(name, graph, lcc, token, upper_bound, astar_pair_budget, seed):
+    if name == "DijkstraMax":
+        return DijkstraMax(graph, lcc).incumbents(token, upper_bound)
+    if name == "DFS":
+        return DFS(graph).incumbents(lcc, token, upper_bound)
+    if name == "A*":
+        astar = aStar(graph, lcc)
+        pairs = None if astar_pair_budget is None else astar.pruned_pairs(max_pairs=astar_pair_budget)
+        return astar.incumbents(token, pairs)
+    if name == "GRASP":
+        return Grasp(graph, lcc).incumbents(token, seed=seed)
+    raise ValueError(f"Unknown solver: {name}")
+
+
+def _run_solver(name, graph, lcc, best, stop, messages, deadline, upper_bound, astar_pair_budget, seed):
+    token = CancellationToken(deadline - time.time(), cancelled=stop)
+
+    def report(path):
+        with best.get_lock():
+            if len(path) > best.value:
+                best.value = len(path)
+        messages.put(('incumbent', name, path))
+        if len(path) >= upper_bound:
+            stop.set()
+
+    proven = False
+    if name == "Branch and Bound":
+        branch_and_bound = BranchAndBound(graph, lcc, shared_best=best, upper_bound=upper_bound)
+        _, path, proven = branch_and_bound.find_longest_path(token)
+        if path:
+            report(path)
+    else:
+        solve_anytime(_incumbents(name, graph, lcc, token, upper_bound, astar_pair_budget, seed), on_incumbent=report,
+                      upper_bound=upper_bound)
+    messages.put(('done', name, proven))
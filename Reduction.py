@@ -0,0 +1,255 @@
+import time
+
+
+class Reduction:
+    """LCC with pendant trees collapsed into vertex tails and degree-2 chains contracted into weighted edges."""
+
+    def __init__(self, graph, lcc, incumbent=None, upper_bound=None):
+        self.graph = graph
+        self.lcc = lcc
+        self.upper_bound = len(lcc) if upper_bound is None else upper_bound  # Most vertices any path can have
+        # A known simple path of the LCC to beat
+        self.incumbent = list(incumbent) if incumbent and self.is_simple_path(incumbent) else []
+        self.parent = {}  # Peeled vertex -> the neighbor it hangs from
+        self.down = {}  # Vertex -> [(depth, child)], the two deepest peeled branches below it
+        self.core = []  # Vertices left after peeling the pendant trees
+        self.chains = []  # (u, v, interior vertices from u to v); weight is len(interior) + 1
+        self.adjacency = {}  # Branch vertex -> [(other end, chain id)], loops included once
+        self.peel_pendant_trees()
+        self.contract_chains()
+
+    def is_simple_path(self, path):
+        in_lcc = set(self.lcc)
+        if len(path) != len(set(path)) or not all(v in in_lcc for v in path):
+            return False
+        return all(path[i + 1] in self.graph.vertices[path[i]] for i in range(len(path) - 1))
+
+    def peel_pendant_trees(self):
+        # Repeatedly remove degree-1 vertices; each peeled vertex is processed after all of its children
+        in_lcc = set(self.lcc)
+        adjacency = self.graph.adjacency()
+        degree = {v: sum(1 for w in adjacency[v] if w in in_lcc) for v in self.lcc}
+        peeled = set()
+        queue = [v for v in self.lcc if degree[v] <= 1]
+        remaining = len(self.lcc)
+        for v in queue:
+            parent = next((w for w in adjacency[v] if w in in_lcc and w not in peeled and w != v), None)
+            if remaining == 1 or parent is None:
+                break
+            peeled.add(v)
+            remaining -= 1
+            self.parent[v] = parent
+            degree[parent] -= 1
+            if degree[parent] == 1:
+                queue.append(parent)
+            depth = self.down[v][0][0] + 1 if v in self.down else 1
+            branches = self.down.setdefault(self.parent[v], [])
+            branches.append((depth, v))
+            branches.sort(key=lambda branch: branch[0], reverse=True)
+            del branches[2:]
+        self.core = [v for v in self.lcc if v not in peeled]
+        self.core_set = set(self.core)
+
+    def contract_chains(self):
+        adjacency = self.graph.adjacency()
+        core_neighbors = {v: [w for w in adjacency[v] if w in self.core_set] for v in self.core}
+        branch = {v for v in self.core if len(core_neighbors[v]) != 2 or v in self.down}
+        if self.core and not branch:
+            branch = {self.core[0]}  # The core is a plain cycle, anchor it at one vertex
+        self.branch = [v for v in self.core if v in branch]
+        self.adjacency = {v: [] for v in self.branch}
+
+        on_chain = set()
+        for u in self.branch:
+            for w in core_neighbors[u]:
+                if w in branch:
+                    if u < w:  # Direct branch-branch edges are seen from both ends
+                        self.add_chain(u, w, [])
+                    continue
+                if w in on_chain:
+                    continue
+                previous, current, interior = u, w, []
+                while current not in branch:
+                    interior.append(current)
+                    on_chain.add(current)
+                    a, b = core_neighbors[current]
+                    previous, current = current, (b if a == previous else a)
+                self.add_chain(u, current, interior)
+
+    def add_chain(self, u, v, interior):
+        chain_id = len(self.chains)
+        self.chains.append((u, v, interior))
+        self.adjacency[u].append((v, chain_id))
+        if v != u:
+            self.adjacency[v].append((u, chain_id))
+
+    def weight(self, chain_id):
+        return len(self.chains[chain_id][2]) + 1
+
+    def tail_path(self, v):
+        # Longest path from v down into its pendant tree
+        path = [v]
+        while path[-1] in self.down:
+            path.append(self.down[path[-1]][0][1])
+        return path
+
+    def chain_path(self, chain_id, start):
+        # Vertices of the chain after `start` up to and including its other end
+        u, v, interior = self.chains[chain_id]
+        if start == u:
+            return interior + [v]
+        return interior[::-1] + [u]
+
+    def end_options(self, v, on_path, used):
+        # Ways to extend a path that ends at v: its pendant tree, or part of an unused chain whose far end is taken
+        options = [(self.down[v][0][0], ('tail', v))] if v in self.down else []
+        for w, chain_id in self.adjacency[v]:
+            if chain_id not in used and (w == v or w in on_path) and self.weight(chain_id) > 1:
+                options.append((self.weight(chain_id) - 1, chain_id))
+        options.sort(key=lambda option: option[0], reverse=True)
+        return options[:2]
+
+    def best_ends(self, first, last, on_path, used):
+        # Best (value, first option, last option) for the two ends, never using the same chain twice
+        best = (0, None, None)
+        first_options = self.end_options(first, on_path, used) + [(0, None)]
+        last_options = self.end_options(last, on_path, used) + [(0, None)]
+        for first_value, first_option in first_options:
+            for last_value, last_option in last_options:
+                if first_option is not None and first_option == last_option:
+                    # Both ends want the same chain: its interior can only be walked once
+                    if first_value > best[0]:
+                        best = (first_value, first_option, None)
+                elif first_value + last_value > best[0]:
+                    best = (first_value + last_value, first_option, last_option)
+        return best
+
+    def find_longest_path(self, time_limit=None):
+        """Return (length in edges, path, proven_optimal) searching over the reduced weighted graph."""
+        if not self.lcc:
+            return -1, [], True
+        deadline = None if time_limit is None else time.time() + time_limit
+        best = self.best_single_vertex_paths()
+        if len(self.incumbent) - 1 > best[0]:
+            best = (len(self.incumbent) - 1, 'incumbent', self.incumbent)
+        # Most an end can add: its pendant tree, or the interior of one chain at it
+        self.max_end = {v: max([self.down[v][0][0] if v in self.down else 0] +
+                               [self.weight(c) - 1 for _, c in self.adjacency[v]]) for v in self.branch}
+        self.steps = 0
+        proven = True
+        for start in self.branch:
+            if best[0] >= self.upper_bound - 1:
+                break  # A path reaching the upper bound cannot be beaten
+            best, completed = self.search_from(start, best, deadline)
+            if not completed:
+                proven = False
+                break
+        return best[0], self.expand(best), proven
+
+    def best_single_vertex_paths(self):
+        # Paths that never use a chain: inside one pendant tree, or through a single core vertex
+        best = (0, 'vertex', self.lcc[0])
+        for v, branches in self.down.items():
+            length = sum(depth for depth, _ in branches)
+            if v not in self.core_set and length > best[0]:
+                best = (length, 'tree', v)
+        for v in self.branch:
+            options = [(depth, ('branch', child)) for depth, child in self.down.get(v, [])]
+            options += [(self.weight(c) - 1, c) for w, c in self.adjacency[v] if w == v]
+            options.sort(key=lambda option: option[0], reverse=True)
+            length = sum(value for value, _ in options[:2])
+            if length > best[0]:
+                best = (length, 'core', v, [option for _, option in options[:2]])
+        return best
+
+    def reachable_exceeds(self, tip, on_path, used, needed):
+        # Upper bound on the original vertices still to come: the unvisited branch vertices reachable from tip,
+        # the interiors of the unused chains touching them (each once), and the best possible end
+        seen = {tip}
+        counted = set()
+        queue = [tip]
+        total = self.max_end[tip]
+        for u in queue:
+            for w, _ in self.adjacency[u]:
+                if w in seen or w in on_path:
+                    continue
+                seen.add(w)
+                queue.append(w)
+                total = max(total, self.max_end[w])  # The path ends at tip or at one of these
+        total += len(queue) - 1
+        if total > needed:
+            return True
+        for w in queue[1:]:
+            for _, chain_id in self.adjacency[w]:
+                if chain_id not in used and chain_id not in counted:
+                    counted.add(chain_id)
+                    total += self.weight(chain_id) - 1
+                    if total > needed:
+                        return True
+        return False
+
+    def search_from(self, start, best, deadline):
+        # Backtracking over reduced simple paths from start; returns (best, completed)
+        path, chains_used, used, on_path = [start], [], set(), {start}
+        weight = 0
+        stack = [iter(self.adjacency[start])]
+        while stack:
+            self.steps += 1
+            if deadline is not None and self.steps % 256 == 0 and time.time() > deadline:
+                return best, False
+            for w, chain_id in stack[-1]:
+                if w in on_path:
+                    continue
+                path.append(w)
+                chains_used.append(chain_id)
+                used.add(chain_id)
+                on_path.add(w)
+                weight += self.weight(chain_id)
+                value, first, last = self.best_ends(start, w, on_path, used)
+                if weight + value > best[0]:
+                    best = (weight + value, 'path', list(path), list(chains_used), first, last)
+                if best[0] < self.upper_bound - 1 and \
+                        self.reachable_exceeds(w, on_path, used, best[0] - weight - self.max_end[start]):
+                    stack.append(iter(self.adjacency[w]))
+                    break
+                weight -= self.weight(chain_id)
+                on_path.discard(path.pop())
+                used.discard(chains_used.pop())
+            else:
+                stack.pop()
+                if chains_used:
+                    weight -= self.weight(chains_used[-1])
+                    used.discard(chains_used.pop())
+                on_path.discard(path.pop())
+        return best, True
+
+    def extension(self, v, option):
+        # Original vertices after v for an end option: down its pendant tree or into a chain's interior
+        if option is None:
+            return []
+        if not isinstance(option, tuple):
+            return self.chain_path(option, v)[:-1]
+        if option[0] == 'tail':
+            return self.tail_path(v)[1:]
+        return self.tail_path(option[1])  # ('branch', child) of a single-vertex path
+
+    def expand(self, best):
+        kind = best[1]
+        if kind == 'vertex':
+            return [best[2]]
+        if kind == 'incumbent':
+            return list(best[2])
+        if kind == 'tree':
+            v = best[2]
+            halves = [self.tail_path(child) for _, child in self.down[v]]
+            return halves[0][::-1] + [v] + (halves[1] if len(halves) > 1 else [])
+        if kind == 'core':
+            v, options = best[2], best[3]
+            first = self.extension(v, options[0])
+            second = self.extension(v, options[1]) if len(options) > 1 else []
+            return first[::-1] + [v] + second
+        _, _, path, chains_used, first, last = best
+        expanded = self.extension(path[0], first)[::-1] + [path[0]]
+        for u, chain_id in zip(path, chains_used):
+            expanded.extend(self.chain_path(chain_id, u))
+        return expanded + self.extension(path[-1], last)
@@ -0,0 +1,56 @@
+import json
+import sqlite3
+
+
+class ResultCache:
+    """Persistent store of solver results in SQLite, keyed on the graph's content hash, the solver and its
+    parameters. Keeps at most max_entries results, evicting the least recently used ones first.
+
+    Paths are stored as vertex labels, so a result stays valid however the graph was loaded."""
+
+    def __init__(self, path='lsp_results.sqlite', max_entries=1000):
+        self.max_entries = max_entries
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("""CREATE TABLE IF NOT EXISTS results (
+            graph TEXT, solver TEXT, params TEXT, path TEXT, length INTEGER, seconds REAL, optimal INTEGER,
+            details TEXT, last_used INTEGER, PRIMARY KEY (graph, solver, params))""")
+        self.connection.commit()
+
+    def close(self):
+        self.connection.close()
+
+    def params_key(self, params):
+        return json.dumps(params or {}, sort_keys=True)
+
+    def next_use(self):
+        # Increasing use counter for the LRU order, so uses within the same clock tick stay ordered
+        return self.connection.execute("SELECT COALESCE(MAX(last_used), 0) + 1 FROM results").fetchone()[0]
+
+    def get(self, graph_hash, solver, params=None):
+        """Return the stored result as a dict (path, length, seconds, optimal, details), or None."""
+        key = (graph_hash, solver, self.params_key(params))
+        row = self.connection.execute("SELECT path, length, seconds, optimal, details FROM results "
+                                      "WHERE graph = ? AND solver = ? AND params = ?", key).fetchone()
+        if row is None:
+            return None
+        self.connection.execute("UPDATE results SET last_used = ? WHERE graph = ? AND solver = ? AND params = ?",
+                                (self.next_use(),) + key)
+        self.connection.commit()
+        path, length, seconds, optimal, details = row
+        return {'path': json.loads(path), 'length': length, 'seconds': seconds, 'optimal': bool(optimal),
+                'details': json.loads(details)}
+
+    def put(self, graph_hash, solver, params, path, length, seconds, optimal=False, details=None):
+        """Store a result (path as vertex labels, length in the solver's own unit) and evict past max_entries."""
+        self.connection.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                (graph_hash, solver, self.params_key(params), json.dumps(list(path)), length,
+                                 seconds, int(optimal), json.dumps(details or {}), self.next_use()))
+        self.connection.execute("DELETE FROM results WHERE rowid IN (SELECT rowid FROM results "
+                                "ORDER BY last_used DESC LIMIT -1 OFFSET ?)", (self.max_entries,))
+        self.connection.commit()
+
+    def best_path(self, graph_hash):
+        """Longest stored path of the graph over all solvers and parameters, as labels; a warm incumbent."""
+        paths = [json.loads(path) for path, in
+                 self.connection.execute("SELECT path FROM results WHERE graph = ?", (graph_hash,))]
+        return max(paths, key=len, default=[])
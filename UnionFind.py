@@ -0,0 +1,76 @@
+from array import array
+
+
+class UnionFind:
+    """Disjoint sets over dense vertex ids 0..n-1 with path compression and union by size."""
+
+    def __init__(self, n=0, typecode=None):
+        # With an array typecode ('i' for up to 2^31 - 1 vertices) parent and size are compact arrays of machine
+        # integers instead of lists of Python ints
+        self.parent = list(range(n)) if typecode is None else array(typecode, range(n))
+        self.size = [1] * n if typecode is None else array(typecode, [1]) * n
+        self.largest = 1 if n else 0  # Size of the biggest set seen so far
+
+    @classmethod
+    def from_arrays(cls, parent, size):
+        """Sets given by parent and size arrays, such as those of a GraphCache file; both are copied."""
+        components = cls()
+        components.parent = array('i', parent)
+        components.size = array('i', size)
+        components.largest = max((components.size[v] for v in range(len(parent)) if parent[v] == v), default=0)
+        return components
+
+    def add(self, count=1):
+        """Add `count` new singleton sets and return the id of the first."""
+        v = len(self.parent)
+        self.parent.extend(range(v, v + count))
+        self.size.extend([1] * count)
+        self.largest = max(self.largest, 1)
+        return v
+
+    def find(self, v):
+        parent = self.parent
+        while parent[v] != v:
+            parent[v] = parent[parent[v]]  # Path halving
+            v = parent[v]
+        return v
+
+    def union(self, u, v):
+        """Merge the sets of u and v, returning True if they were different sets."""
+        u, v = self.find(u), self.find(v)
+        if u == v:
+            return False
+        if self.size[u] < self.size[v]:
+            u, v = v, u
+        self.parent[v] = u
+        self.size[u] += self.size[v]
+        if self.size[u] > self.largest:
+            self.largest = self.size[u]
+        return True
+
+    def components(self):
+        """Members of every set keyed by root, each list in increasing id order."""
+        members = {}
+        for v in range(len(self.parent)):
+            members.setdefault(self.find(v), []).append(v)
+        return members
+
+    def largest_component(self):
+        """Members of the largest set, taking the set of the smallest id on ties (like DFS.DFS_LCC)."""
+        if not self.parent:
+            return []
+        best_root = None
+        for v in range(len(self.parent)):
+            root = self.find(v)
+            if self.size[root] == self.largest:
+                best_root = root
+                break
+        return [v for v in range(len(self.parent)) if self.find(v) == best_root]
+
+    def size_histogram(self):
+        """Number of sets of each size, ordered by size."""
+        histogram = {}
+        for v in range(len(self.parent)):
+            if self.parent[v] == v:
+                histogram[self.size[v]] = histogram.get(self.size[v], 0) + 1
+        return dict(sorted(histogram.items()))
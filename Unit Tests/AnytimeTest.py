@@ -0,0 +1,56 @@
+import unittest
+from Anytime import CancellationToken, solve_anytime
+from DFS import DFS
+from DijkstraMax import DijkstraMax
+from Graph import Graph
+
+
+class AnytimeTest(unittest.TestCase):
+    def setUp(self):
+        # Initialize the graph
+        self.graph = Graph()
+
+        edges = [(2, 3), (3, 4), (4, 5), (3, 6), (1, 7), (7, 8),
+                 (8, 9), (9, 10), (10, 11), (11, 12)]
+
+        # Add vertices
+        for i in range(1, 13):
+            self.graph.add_vertex(i)
+
+        for u, v in edges:
+            self.graph.add_edge(u, v)
+
+        # Largest connected component of the graph above
+        self.lcc = [9, 1, 7, 8, 10, 11, 12]
+
+    def test_token(self):
+        token = CancellationToken()
+        self.assertFalse(token.expired())
+        token.cancel()
+        self.assertTrue(token.expired())
+        self.assertTrue(CancellationToken(time_limit=-1).expired(), "A deadline in the past has expired")
+
+    def test_incumbents_improve(self):
+        seen = []
+        path = solve_anytime(DijkstraMax(self.graph, self.lcc).incumbents(), on_incumbent=seen.append)
+
+        self.assertEqual(len(path), 7)
+        self.assertEqual(path, seen[-1], "The last incumbent is the returned path")
+        self.assertTrue(all(len(a) < len(b) for a, b in zip(seen, seen[1:])), "Every incumbent is longer")
+
+    def test_cancellation_keeps_best_so_far(self):
+        token = CancellationToken()
+        seen = []
+
+        def cancel_after_first(path):
+            seen.append(path)
+            token.cancel()
+
+        path = solve_anytime(DFS(self.graph).incumbents(self.lcc, token), on_incumbent=cancel_after_first)
+
+        # Start 9 reaches 1 first (its neighbors are 8, 10), no other start is searched after the cancellation
+        self.assertEqual(path, [9, 8, 7, 1])
+        self.assertEqual(len(seen), 1)
+
+if __name__ == '__main__':
+    unittest.main()
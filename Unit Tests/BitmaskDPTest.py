@@ -0,0 +1,48 @@
+import unittest
+from BitmaskDP import BitmaskDP
+from Graph import Graph
+
+
+class BitmaskDPTest(unittest.TestCase):
+    def setUp(self):
+        # Initialize the graph
+        self.graph = Graph()
+
+        # A 5-cycle with a pendant vertex 6 on 1 and a chord 2-5
+        edges = [(1, 2), (2, 3), (3, 4), (4, 5), (5, 1), (1, 6), (2, 5)]
+
+        # Add vertices
+        for i in range(1, 7):
+            self.graph.add_vertex(i)
+
+        for u, v in edges:
+            self.graph.add_edge(u, v)
+
+        self.lcc = list(range(1, 7))
+
+    def test_find_longest_path(self):
+        length, path = BitmaskDP(self.graph, self.lcc).find_longest_path()
+
+        self.assertEqual(length, 5, "The longest path should be Hamiltonian")
+        self.assertEqual(len(path), len(set(path)), "Path should not contain duplicate nodes")
+        self.assertTrue(all(path[i + 1] in self.graph.vertices[path[i]] for i in range(len(path) - 1)))
+        self.assertIn(6, (path[0], path[-1]), "The pendant vertex can only be an endpoint")
+
+    def test_star_is_not_hamiltonian(self):
+        star = Graph()
+        for i in range(5):
+            star.add_vertex(i)
+        for leaf in range(1, 5):
+            star.add_edge(0, leaf)
+
+        length, path = BitmaskDP(star, list(range(5))).find_longest_path()
+        self.assertEqual(length, 2)
+        self.assertEqual(path[1], 0)
+
+    def test_rejects_large_components(self):
+        with self.assertRaises(ValueError):
+            BitmaskDP(self.graph, list(range(BitmaskDP.max_vertices + 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import random
+import time
+import unittest
+from BlockCutTree import BlockCutTree, solve_block
+from Graph import Graph
+
+
+class BlockCutTreeTest(unittest.TestCase):
+    def setUp(self):
+        # Initialize the graph
+        self.graph = Graph()
+
+        # Triangle 1-2-3, bridge 3-4, square 4-5-6-7 and a pendant 8 on 6
+        edges = [(1, 2), (2, 3), (3, 1), (3, 4), (4, 5), (5, 6), (6, 7), (7, 4), (6, 8)]
+
+        # Add vertices
+        for i in range(1, 9):
+            self.graph.add_vertex(i)
+
+        for u, v in edges:
+            self.graph.add_edge(u, v)
+
+        self.tree = BlockCutTree(self.graph, list(range(1, 9)))
+
+    def test_decompose(self):
+        blocks = sorted(sorted(block) for block in self.tree.blocks)
+        self.assertEqual(blocks, [[1, 2, 3], [3, 4], [4, 5, 6, 7], [6, 8]])
+        self.assertEqual(self.tree.cut_vertices, {3, 4, 6})
+
+    def test_find_longest_path(self):
+        length, path, optimal = self.tree.find_longest_path()
+
+        # e.g. 1-2-3-4-7-6-5 or 2-1-3-4-5-6-8 : both have 6 edges
+        self.assertEqual(length, 6)
+        self.assertEqual(len(path), length + 1)
+        self.assertEqual(len(path), len(set(path)), "Path should not contain duplicate nodes")
+        self.assertTrue(all(path[i + 1] in self.graph.vertices[path[i]] for i in range(len(path) - 1)))
+        self.assertTrue(optimal)
+
+    def test_solve_block_past_deadline(self):
+        # A block too large for the subset DP still returns a valid path when the shared deadline has passed
+        graph = Graph()
+        for i in range(30):
+            graph.add_vertex(i)
+        for i in range(30):
+            graph.add_edge(i, (i + 1) % 30)
+            graph.add_edge(i, (i + 7) % 30)
+        block = list(range(30))
+        (length, path), _, exact = solve_block(graph, block, [], None, deadline=time.time() - 1)
+
+        self.assertEqual(len(path), length + 1)
+        self.assertEqual(len(path), len(set(path)), "Path should not contain duplicate nodes")
+        self.assertTrue(all(path[i + 1] in graph.vertices[path[i]] for i in range(len(path) - 1)))
+        self.assertFalse(exact)
+
+    def test_incumbent_seeds_large_blocks(self):
+        # A 60-vertex block around a shuffled Hamiltonian cycle, plus a pendant 60 on its first vertex. With no
+        # time to search, the tree paths of the block fall short of the incumbent that visits every vertex.
+        rng = random.Random(0)
+        graph = Graph()
+        for i in range(61):
+            graph.add_vertex(i)
+        order = list(range(60))
+        rng.shuffle(order)
+        for _ in range(60):
+            graph.add_edge(*rng.sample(range(60), 2))
+        for u, v in zip(order, order[1:] + order[:1]):
+            graph.add_edge(u, v)
+        graph.add_edge(60, order[0])
+        tree = BlockCutTree(graph, list(range(61)))
+        incumbent = [60] + order
+
+        self.assertLess(tree.find_longest_path(time_limit=0)[0], 60)
+        length, path, optimal = tree.find_longest_path(time_limit=0, incumbent=incumbent)
+        self.assertEqual(length, 60)
+        self.assertEqual(sorted(path), list(range(61)))
+        self.assertTrue(all(path[i + 1] in graph.vertices[path[i]] for i in range(len(path) - 1)))
+        self.assertFalse(optimal)
+
+        # The part of the incumbent inside the block seeds its search
+        cuts = [order[0]]
+        (length, path), _, _ = solve_block(graph, order, cuts, 0, incumbent=order)
+        self.assertEqual(length, 59)
+
+        # A path that is not simple is ignored
+        self.assertLess(tree.find_longest_path(time_limit=0, incumbent=[60] + order + [order[0]])[0], 60)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+from Bounds import Bounds
+from DFS import DFS
+from Graph import Graph
+
+
+class BoundsTest(unittest.TestCase):
+    def setUp(self):
+        # Initialize the graph
+        self.graph = Graph()
+
+        # Triangle 1-2-3, bridge 3-4, square 4-5-6-7 and pendants 8 on 6 and 9 on 5
+        edges = [(1, 2), (2, 3), (3, 1), (3, 4), (4, 5), (5, 6), (6, 7), (7, 4), (6, 8), (5, 9)]
+
+        # Add vertices
+        for i in range(1, 10):
+            self.graph.add_vertex(i)
+
+        for u, v in edges:
+            self.graph.add_edge(u, v)
+
+        self.bounds = Bounds(self.graph, list(range(1, 10)))
+
+    def test_degree_bound(self):
+        # 8 and 9 are the only degree-1 vertices, both can be ends
+        self.assertEqual(self.bounds.degree_bound(), 9)
+
+    def test_block_cut_bound(self):
+        # Best block chain: triangle, bridge, square and one pendant bridge, sharing 3 cut vertices
+        self.assertEqual(self.bounds.block_cut_bound(), 3 + 2 + 4 + 2 - 3)
+
+    def test_bipartite_bound(self):
+        # A star with 4 leaves: every path alternates center and leaf
+        star = Graph()
+        for i in range(5):
+            star.add_vertex(i)
+        for leaf in range(1, 5):
+            star.add_edge(0, leaf)
+        self.assertEqual(Bounds(star, list(range(5))).bipartite_bound(), 3)
+        self.assertEqual(self.bounds.bipartite_bound(), 9)  # The triangle is an odd cycle
+
+    def test_upper_bound_and_gap(self):
+        # 1-2-3-4-7-6-5-9 is a longest path with 8 vertices
+        self.assertEqual(self.bounds.upper_bound(), 8)
+        self.assertEqual(self.bounds.gap([1, 2, 3, 4, 7, 6, 5, 9]), 0)
+        self.assertEqual(self.bounds.gap([1, 2, 3, 4]), 4)
+
+    def test_dfs_stops_at_bound(self):
+        dfs = DFS(self.graph)
+        length, path = dfs.find_lsp(list(range(1, 10)))
+        self.assertLessEqual(len(path), self.bounds.upper_bound())
+        self.assertEqual((length, path), DFS(self.graph).find_lsp(list(range(1, 10)), upper_bound=9))
+
+        # Only the first start is searched once its path reaches the given bound
+        self.assertEqual(len(list(dfs.incumbents(list(range(1, 10)), upper_bound=1))), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from BranchAndBound import BranchAndBound
+from Graph import Graph
+
+
+class BranchAndBoundTest(unittest.TestCase):
+    def setUp(self):
+        # Initialize the graph
+        self.graph = Graph()
+
+        edges = [(2, 3), (3, 4), (4, 5), (3, 6), (1, 7), (7, 8),
+                 (8, 9), (9, 10), (10, 11), (11, 12), (7, 9), (8, 10)]
+
+        # Add vertices
+        for i in range(1, 13):
+            self.graph.add_vertex(i)
+
+        for u, v in edges:
+            self.graph.add_edge(u, v)
+
+        # Largest connected component of the graph above
+        self.lcc = [1, 7, 8, 9, 10, 11, 12]
+
+    def test_find_longest_path(self):
+        length, path, optimal = BranchAndBound(self.graph, self.lcc).find_longest_path()
+
+        self.assertEqual(length, 6, "The longest path should visit the whole component")
+        self.assertEqual(len(path), len(set(path)), "Path should not contain duplicate nodes")
+        self.assertTrue(all(path[i + 1] in self.graph.vertices[path[i]] for i in range(len(path) - 1)))
+        self.assertTrue(optimal)
+
+    def test_incumbent_is_kept_when_optimal(self):
+        incumbent = [1, 7, 9, 8, 10, 11, 12]
+        length, path, optimal = BranchAndBound(self.graph, self.lcc, incumbent=incumbent).find_longest_path()
+
+        self.assertEqual(path, incumbent, "A Hamiltonian incumbent cannot be improved")
+        self.assertTrue(optimal)
+
+    def test_invalid_incumbent_is_ignored(self):
+        solver = BranchAndBound(self.graph, self.lcc, incumbent=[1, 8, 12])
+        self.assertEqual(solver.best_path, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
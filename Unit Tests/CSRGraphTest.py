@@ -0,0 +1,66 @@
+import pickle
+import unittest
+from CSRGraph import CSRGraph
+from Graph import Graph
+
+
+class CSRGraphTest(unittest.TestCase):
+    def setUp(self):
+        # Path 10 - 20 - 30 plus the edge 20 - 40, with file ids as labels
+        self.graph = Graph()
+        for label, point in [(10, (0.1, 0.2)), (20, (0.3, 0.4)), (30, (0.5, 0.6)), (40, (0.7, 0.8))]:
+            self.graph.add_vertex_with_coordinates(label, point)
+        for u, v in [(10, 20), (20, 30), (40, 20)]:
+            self.graph.add_edge(u, v)
+        self.csr = CSRGraph.from_graph(self.graph)
+
+    def test_from_graph(self):
+        self.assertEqual(self.csr.n, 4)
+        self.assertEqual(self.csr.labels, [10, 20, 30, 40])
+        self.assertEqual(dict(self.csr.vertices), {0: (1,), 1: (0, 2, 3), 2: (1,), 3: (1,)})
+        self.assertEqual(self.csr.number_of_edges(), 3)
+        self.assertEqual(self.csr.degree(1), 3)
+        self.assertEqual(self.csr.get_coordinates(3), (0.7, 0.8))
+        self.assertEqual(self.csr.get_coordinates(4), (None, None))
+
+    def test_from_edges(self):
+        # Duplicate edges and self-loops are dropped, neighbors come out sorted
+        csr = CSRGraph.from_edges(4, [(0, 2), (2, 0), (1, 1), (2, 1), (3, 2)])
+        self.assertEqual(csr.adjacency(), [(2,), (2,), (0, 1, 3), (2,)])
+        self.assertEqual(csr.labels, [0, 1, 2, 3])
+        self.assertEqual(csr.largest_component(), [0, 1, 2, 3])
+
+    def test_adjacency_view(self):
+        self.assertEqual(list(self.csr.vertices), [0, 1, 2, 3])
+        self.assertEqual(len(self.csr.vertices), 4)
+        self.assertIn(3, self.csr.vertices)
+        self.assertNotIn(4, self.csr.vertices)
+        with self.assertRaises(KeyError):
+            self.csr.vertices[-1]
+        self.assertIs(self.csr.vertices[1], self.csr.adjacency()[1])
+
+    def test_labels(self):
+        self.assertEqual(self.csr.index_of(40), 3)
+        self.assertEqual(self.csr.to_labels([0, 1, 3]), [10, 20, 40])
+
+    def test_new_vertex_state(self):
+        state = self.csr.new_vertex_state(False)
+        self.assertEqual(state, [False] * 4)
+        state[0] = True
+        self.assertEqual(self.csr.new_vertex_state(False), [False] * 4, "Every call returns fresh state")
+
+    def test_pickle(self):
+        self.csr.adjacency()
+        copy = pickle.loads(pickle.dumps(self.csr))
+        self.assertEqual(copy.adjacency(), self.csr.adjacency())
+        self.assertEqual(copy.labels, self.csr.labels)
+        self.assertEqual(copy.get_coordinates(2), (0.5, 0.6))
+
+        # A graph over memoryviews, as GraphCache maps them, pickles as well
+        mapped = CSRGraph(memoryview(self.csr.offsets), memoryview(self.csr.neighbors), self.csr.labels,
+                          memoryview(self.csr.coordinates))
+        self.assertEqual(pickle.loads(pickle.dumps(mapped)).adjacency(), self.csr.adjacency())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import random
+import unittest
+from DFS import DFS
+from Graph import Graph
+
+
+class RecursiveDFS(DFS):
+    """The original recursive dfs_visit, as the reference for the iterative one."""
+
+    def dfs_visit(self, vertex, current_length=0, current_path=None, component=None):
+        self.color[vertex] = 'GRAY'
+        if component is not None:
+            component.append(vertex)
+        if current_path is not None:
+            current_path.append(vertex)
+            current_length += 1
+            if current_length > self.lsp_length:
+                self.lsp_length = current_length
+                self.lsp_path = list(current_path)
+
+        for next_vertex in self.graph.vertices[vertex]:
+            if self.color[next_vertex] == 'WHITE':
+                self.predecessor[next_vertex] = vertex
+                self.dfs_visit(next_vertex, current_length, current_path, component)
+
+        self.color[vertex] = 'BLACK'
+        if current_path is not None:
+            current_path.pop()
+
+
+class DFSTest(unittest.TestCase):
+    def random_graphs(self, count=20):
+        for seed in range(count):
+            random.seed(seed)
+            graph = Graph()
+            graph.generate_random_geometric_graph(random.randint(10, 60), random.uniform(0.15, 0.35))
+            yield seed, graph
+
+    def test_iterative_matches_recursive(self):
+        for seed, graph in self.random_graphs():
+            iterative, recursive = DFS(graph), RecursiveDFS(graph)
+            self.assertEqual(iterative.DFS_LCC(), recursive.DFS_LCC(), seed)
+            self.assertEqual(iterative.predecessor, recursive.predecessor, seed)
+            lcc = iterative.DFS_LCC()
+            upper_bound = len(lcc) + 1  # Never reached, so every start vertex is searched
+            self.assertEqual(iterative.find_lsp(lcc, upper_bound=upper_bound),
+                             recursive.find_lsp(lcc, upper_bound=upper_bound), seed)
+
+    def test_parallel_matches_serial(self):
+        for seed, graph in self.random_graphs(5):
+            lcc = graph.largest_component()
+            self.assertEqual(DFS(graph).find_lsp(lcc, workers=2), DFS(graph).find_lsp(lcc), seed)
+
+    def test_parallel_keeps_earliest_start(self):
+        # Every start of a 6-cycle finds a 6-vertex path; with a bound above that, all starts run and tie
+        graph = Graph()
+        for i in range(6):
+            graph.add_vertex(i)
+        for i in range(6):
+            graph.add_edge(i, (i + 1) % 6)
+        lcc = [3, 1, 4, 0, 5, 2]
+
+        serial = DFS(graph).find_lsp(lcc, upper_bound=7)
+        parallel = DFS(graph).find_lsp(lcc, workers=2, upper_bound=7)
+        self.assertEqual(parallel, serial)
+        self.assertEqual(parallel[1][0], 3, "The path of the first start vertex wins the tie")
+
+
+if __name__ == '__main__':
+    unittest.main()
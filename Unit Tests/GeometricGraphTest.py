@@ -0,0 +1,71 @@
+import math
+import random
+import unittest
+from Graph import Graph
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def brute_force_edges(coordinates, r):
+    # Every pair u < v closer than r, by the O(n^2) loop the grid replaces
+    points = list(coordinates.items())
+    return {(u, v) for i, (u, p) in enumerate(points) for v, q in points[i + 1:]
+            if math.sqrt((p[0] - q[0]) ** 2 + (p[1] - q[1]) ** 2) < r}
+
+
+def edge_set(graph):
+    return {(u, v) for u, neighbors in graph.vertices.items() for v in neighbors if u < v}
+
+
+class GeometricGraphTest(unittest.TestCase):
+    def grid_graph(self):
+        # Points on multiples of 1/8: many lie exactly on cell boundaries or exactly r apart
+        graph = Graph()
+        for i in range(9):
+            for j in range(9):
+                graph.add_vertex_with_coordinates(9 * i + j, (i / 8, j / 8))
+        return graph
+
+    def test_grid_pairs_match_brute_force(self):
+        for seed in range(3):
+            for r in (0.05, 0.1, 0.3):
+                random.seed(seed)
+                graph = Graph()
+                graph.generate_random_geometric_graph(150, r)
+                self.assertEqual(edge_set(graph), brute_force_edges(graph.coordinates, r), (seed, r))
+
+    def test_points_on_cell_boundaries(self):
+        graph = self.grid_graph()
+        for r in (0.125, 0.25, 0.3, 0.5):
+            graph.connect_within(r)
+            self.assertEqual(edge_set(graph), brute_force_edges(graph.coordinates, r), r)
+            pairs = list(graph.geometric_pairs(r))
+            self.assertEqual(len(pairs), len({(u, v) for u, v, _ in pairs}), "Each pair is reported once")
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class GeometricGraphNumpyTest(unittest.TestCase):
+    def test_generated_edges_match_brute_force(self):
+        for seed in range(3):
+            for r in (0.05, 0.1, 0.3):
+                random.seed(seed)
+                graph = Graph()
+                graph.generate_random_geometric_graph_numpy(150, r, block_size=32)
+                self.assertEqual(edge_set(graph), brute_force_edges(graph.coordinates, r), (seed, r))
+                self.assertTrue(all(neighbors == sorted(neighbors) for neighbors in graph.vertices.values()))
+
+    def test_points_on_cell_boundaries(self):
+        points = np.array([(i / 8, j / 8) for i in range(9) for j in range(9)])
+        coordinates = dict(enumerate(map(tuple, points.tolist())))
+        for r in (0.125, 0.25, 0.3, 0.5):
+            u, v = Graph().geometric_pairs_numpy(points, r, block_size=16)
+            pairs = [(min(a, b), max(a, b)) for a, b in zip(u.tolist(), v.tolist())]
+            self.assertEqual(len(pairs), len(set(pairs)), "Each pair is reported once")
+            self.assertEqual(set(pairs), brute_force_edges(coordinates, r), r)
+
+
+if __name__ == '__main__':
+    unittest.main()
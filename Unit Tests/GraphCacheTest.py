@@ -0,0 +1,103 @@
+import os
+import tempfile
+import unittest
+from Graph import Graph
+from GraphCache import GraphCache
+from GraphMetrics import GraphMetrics
+
+
+class GraphCacheTest(unittest.TestCase):
+    def setUp(self):
+        # Path 10 - 20 - 30 - 40 with coordinates, and an edge 50 - 60 apart from it
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "graph.edges")
+        self.write("10 0.1 0.1 20 0.2 0.2\n20 0.2 0.2 30 0.3 0.3\n30 0.3 0.3 40 0.4 0.4\n50 0.5 0.5 60 0.6 0.6\n")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, text):
+        with open(self.file_path, 'w') as file:
+            file.write(text)
+
+    def test_cached_graph_matches_parsed_graph(self):
+        parsed = Graph()
+        parsed.read_graph_from_file(self.file_path)
+        parsed = parsed.compile()
+
+        first = GraphCache(self.file_path)
+        first.load()
+        self.assertFalse(first.hit)
+        self.assertTrue(os.path.exists(first.cache_path))
+
+        second = GraphCache(self.file_path)
+        cached = second.load()
+        self.assertTrue(second.hit)
+        self.assertEqual(list(cached.offsets), list(parsed.offsets))
+        self.assertEqual(list(cached.neighbors), list(parsed.neighbors))
+        self.assertEqual(cached.to_labels(cached.largest_component()), [10, 20, 30, 40])
+        self.assertEqual(cached.get_coordinates(3), (0.4, 0.4))
+        self.assertEqual(sorted(cached.vertices[1]), [0, 2])
+
+    def test_components_come_from_loading(self):
+        # Parsing tracks the components and the cache stores them, so neither load needs a pass over the edges
+        for hit in (False, True):
+            cache = GraphCache(self.file_path)
+            graph = cache.load()
+            self.assertEqual(cache.hit, hit)
+            self.assertIsNotNone(graph.components)
+            self.assertEqual(graph.to_labels(graph.largest_component()), [10, 20, 30, 40])
+            self.assertEqual(graph.component_size_histogram(), {2: 1, 4: 1})
+
+        streamed = GraphCache(self.file_path, largest_component_only=True).load()
+        self.assertIsNotNone(streamed.components)
+        self.assertEqual(streamed.component_size_histogram(), {4: 1})
+
+    def test_truncated_cache_is_parsed_again(self):
+        cache_path = GraphCache(self.file_path).cache_path
+        GraphCache(self.file_path).load()
+        with open(cache_path, 'rb') as file:
+            contents = file.read()
+
+        # Cut inside the header, inside the offsets and neighbors, and just before the end; also one byte too many
+        for size in (40, GraphCache.header.size + 12, len(contents) - 30, len(contents) - 1, len(contents) + 1):
+            with open(cache_path, 'wb') as file:
+                file.write((contents + b'\0')[:size])
+            cache = GraphCache(self.file_path)
+            graph = cache.load()
+            self.assertFalse(cache.hit, size)
+            self.assertEqual(graph.to_labels(graph.largest_component()), [10, 20, 30, 40])
+            with open(cache_path, 'rb') as file:
+                self.assertEqual(file.read(), contents, "The parse writes the cache again")
+
+    def test_changed_file_is_parsed_again(self):
+        GraphCache(self.file_path).load()
+        self.write("10 0.1 0.1 20 0.2 0.2\n")
+
+        cache = GraphCache(self.file_path)
+        graph = cache.load()
+        self.assertFalse(cache.hit)
+        self.assertEqual(graph.to_labels(range(graph.n)), [10, 20])
+
+    def test_largest_component_only(self):
+        cache = GraphCache(self.file_path, largest_component_only=True)
+        graph = cache.load()
+        self.assertNotEqual(cache.cache_path, GraphCache(self.file_path).cache_path)
+        self.assertEqual(graph.to_labels(range(graph.n)), [10, 20, 30, 40])
+        self.assertEqual(graph.largest_component(), [0, 1, 2, 3])
+
+    def test_original_counts(self):
+        # The whole file has 6 vertices and 4 edges, also when the graph and its cache hold only the LCC
+        for largest_component_only in (False, True):
+            for hit in (False, True):
+                cache = GraphCache(self.file_path, largest_component_only)
+                graph = cache.load()
+                self.assertEqual(cache.hit, hit)
+                metrics = GraphMetrics(graph, graph.largest_component(), [])
+                self.assertEqual((metrics.number_of_nodes(), metrics.number_of_edges()), (6, 4))
+                self.assertEqual(metrics.lcc_size(), 4)
+                self.assertEqual(graph.original_counts, (6, 4) if largest_component_only else None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+from Graph import Graph
+
+
+class GraphTest(unittest.TestCase):
+    def setUp(self):
+        # The same path 10 - 20 - 30 with a repeated edge, as a plain edge list read one edge at a time
+        self.directory = tempfile.TemporaryDirectory()
+        self.expected = Graph(track_components=True)
+        self.expected.read_edges_from_file(self.write("plain.edges", "10 20\n20 30\n30 20\n"))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, text):
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w') as file:
+            file.write(text)
+        return path
+
+    def assertLoads(self, name, text, file_format):
+        graph = Graph(track_components=True)
+        path = self.write(name, text)
+        with open(path) as file:
+            self.assertEqual(graph.sniff_file_format(file)[0], file_format)
+        graph.read_graph_from_file(path)
+        self.assertEqual(graph.vertices, self.expected.vertices)
+        self.assertEqual(graph.labels, [10, 20, 30])
+        self.assertEqual(graph.largest_component(), [0, 1, 2])
+        return graph
+
+    def test_plain_edges(self):
+        self.assertLoads("plain.edges", "10 20\n20 30\n30 20\n", 'edges')
+
+    def test_matrix_market(self):
+        text = "%%MatrixMarket matrix coordinate pattern symmetric\n% comment\n30 30 3\n10 20\n20 30\n30 20\n"
+        self.assertLoads("graph.mtx", text, 'matrix market')
+        weighted = "%%MatrixMarket matrix coordinate real symmetric\n30 30 3\n10 20 1.5\n20 30 2\n30 20 2\n"
+        self.assertLoads("weighted.mtx", weighted, 'matrix market')
+
+    def test_coordinate_edges(self):
+        text = "10 0.1 0.2 20 0.3 0.4\n20 0.3 0.4 30 0.5 0.6\n30 0.5 0.6 20 0.3 0.4\n"
+        graph = self.assertLoads("geometric.edges", text, 'coordinates')
+        self.assertEqual([graph.get_coordinates(v) for v in range(3)], [(0.1, 0.2), (0.3, 0.4), (0.5, 0.6)])
+
+    def test_small_chunks(self):
+        # Chunks of whole lines give the same graph however small they are
+        graph = Graph(track_components=True)
+        graph.read_graph_from_file(self.write("plain.edges", "10 20\n20 30\n30 20\n"), chunk_bytes=1)
+        self.assertEqual(graph.vertices, self.expected.vertices)
+
+    def test_percent_comments_in_plain_edges(self):
+        # Without a %%MatrixMarket banner a % line is a comment, not the start of a Matrix Market header
+        self.assertLoads("commented.edges", "% comment\n10 20\n20 30\n% comment\n30 20\n", 'edges')
+
+    def test_matrix_market_without_banner(self):
+        self.assertLoads("graph.mtx", "% comment\n30 30 3\n10 20\n20 30\n30 20\n", 'matrix market')
+
+    def test_mixed_line_lengths(self):
+        # Edge lines with and without weights in the same chunk
+        self.assertLoads("weighted.edges", "10 20\n20 30 2.5\n30 20\n", 'edges')
+        self.assertLoads("weighted.edges", "10 20 1\n20 30\n30 20 1\n", 'edges')
+
+    def test_no_edge_lines(self):
+        for text in ("", "% comment\n\n# comment\n", "%%MatrixMarket matrix coordinate pattern symmetric\n"):
+            graph = Graph(track_components=True)
+            graph.read_graph_from_file(self.write("empty.mtx", text))
+            self.assertEqual(graph.vertices, {})
+            graph.read_largest_component_from_file(self.write("empty.edges", text))
+            self.assertEqual(graph.vertices, {})
+
+    def test_read_largest_component(self):
+        # Components {1, 2} and {10, 20, 30, 40}, with coordinates, read two lines at a time
+        text = ("1 0.0 0.0 2 0.0 0.1\n10 0.1 0.2 20 0.3 0.4\n20 0.3 0.4 30 0.5 0.6\n"
+                "40 0.7 0.8 30 0.5 0.6\n2 0.0 0.1 1 0.0 0.0\n20 0.3 0.4 10 0.1 0.2\n")
+        path = self.write("components.edges", text)
+        full = Graph()
+        full.read_graph_from_file(path)
+
+        graph = Graph()
+        graph.read_largest_component_from_file(path, chunk_bytes=40)
+        self.assertEqual(graph.labels, [10, 20, 30, 40])
+        self.assertEqual(graph.vertices, {0: [1], 1: [0, 2], 2: [1, 3], 3: [2]})
+        self.assertEqual([graph.get_coordinates(v) for v in range(4)],
+                         [full.get_coordinates(full.label_ids[label]) for label in graph.labels])
+        # 6 vertices; the 3 edges of the component, and the 2 lines of edge 1 - 2 counted as they appear
+        self.assertEqual(graph.original_counts, (6, 5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -51,6 +51,20 @@ class TestGRASP(unittest.TestCase):
         self.assertIn(start_node, self.graph.vertices, "Start node should be a vertex in the graph")
         self.assertEqual(len(path), len(set(path)), "Path should not contain duplicate nodes")
 
+    def test_construction_resets_path_index(self):
+        path = self.grasp.greedy_randomized_construction()
+
+        # Membership and free-neighbor counts must be back to their initial values for the next construction
+        self.assertFalse(any(self.grasp.in_path[v] for v in path))
+        self.assertEqual(self.grasp.free_degree, self.grasp.lcc_degree)
+
+    def test_warnsdorff_candidates(self):
+        # From 3 with 2 on the path: 6 has no free neighbor left, 4 still has 5, so 4 ranks first
+        grasp = Grasp(self.graph, list(range(1, 13)), warnsdorff=True)
+        for v in (2, 3):
+            grasp.add_to_path(v)
+        self.assertEqual(grasp.get_candidates(3, [2, 3], grasp.in_path), [4, 6])
+
     def test_local_search(self):
         # Test the local_search method with a predefined path
         path = [1, 7, 8, 9, 10, 11, 12]  # Example path from 1 to 12
@@ -59,6 +73,26 @@ class TestGRASP(unittest.TestCase):
         # Verify the improved path length is at least the same as the original path
         self.assertTrue(len(improved_path) >= len(path), "Local search should not shorten the path")
 
+    def test_local_search_extends_both_ends(self):
+        improved_path = self.grasp.local_search([8, 9, 10])
+
+        # Both ends walk out to the whole component 1 - 7 - ... - 12
+        self.assertEqual(sorted(improved_path), [1, 7, 8, 9, 10, 11, 12])
+        self.assertFalse(any(self.grasp.in_path[v] for v in improved_path), "Path index must be cleared")
+
+    def test_local_search_rotation(self):
+        # Both ends of 1 - 2 - 3 - 4 are stuck, but the edge 4 - 2 lets 3 become the end and reach 5
+        graph = Graph()
+        for i in range(1, 6):
+            graph.add_vertex(i)
+        for u, v in [(1, 2), (2, 3), (3, 4), (4, 2), (3, 5)]:
+            graph.add_edge(u, v)
+        grasp = Grasp(graph, list(range(1, 6)))
+
+        improved_path = grasp.local_search([1, 2, 3, 4])
+        self.assertEqual(len(improved_path), 5)
+        self.assertTrue(all(improved_path[i + 1] in graph.vertices[improved_path[i]] for i in range(4)))
+
     def test_grasp_longest_path(self):
         # Test the grasp_longest_path method
         longest_path = self.grasp.grasp_longest_path()
@@ -69,6 +103,40 @@ class TestGRASP(unittest.TestCase):
         # Verify that the path contains unique nodes
         self.assertEqual(len(longest_path), len(set(longest_path)), "Longest path should not contain duplicate nodes")
 
+    def test_grasp_parallel_is_reproducible(self):
+        first_path, first_stats = self.grasp.grasp_parallel(iterations=5, seed=3)
+        second_path, second_stats = self.grasp.grasp_parallel(iterations=5, seed=3)
+
+        self.assertEqual(first_path, second_path, "The same seed should give the same path")
+        self.assertEqual([stat['local_search'] for stat in first_stats],
+                         [stat['local_search'] for stat in second_stats])
+        self.assertLessEqual(len(first_stats), 5)
+        self.assertEqual(len(first_path), max(stat['local_search'] for stat in first_stats))
+
+    def test_grasp_parallel_workers_use_settings(self):
+        # The workers run with the instance's candidate list size, not the default one
+        self.grasp.candidate_list_size = 1
+        serial_path, serial_stats = self.grasp.grasp_parallel(iterations=6, seed=3, workers=1)
+        parallel_path, parallel_stats = self.grasp.grasp_parallel(iterations=6, seed=3, workers=2)
+
+        self.assertEqual(serial_path, parallel_path, "Any number of workers should give the same path")
+        serial_constructions = {stat['iteration']: stat['construction'] for stat in serial_stats}
+        for stat in parallel_stats:
+            if stat['iteration'] in serial_constructions:
+                self.assertEqual(stat['construction'], serial_constructions[stat['iteration']])
+
+    def test_grasp_parallel_stops_at_upper_bound(self):
+        # Every iteration finds at least 2 vertices, so a bound of 2 ends the run after the first one
+        path, stats = self.grasp.grasp_parallel(iterations=6, seed=3, upper_bound=2)
+        self.assertEqual([stat['iteration'] for stat in stats], [0])
+        self.assertEqual(len(path), stats[0]['local_search'])
+
+        for upper_bound in (2, 5, 7, 13):
+            serial = self.grasp.grasp_parallel(iterations=6, seed=3, workers=1, upper_bound=upper_bound)
+            parallel = self.grasp.grasp_parallel(iterations=6, seed=3, workers=2, upper_bound=upper_bound)
+            self.assertEqual(parallel[0], serial[0], upper_bound)
+            self.assertEqual([stat['iteration'] for stat in parallel[1]], [stat['iteration'] for stat in serial[1]])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,110 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+import Main
+from Graph import Graph
+from GraphCache import GraphCache
+from ResultCache import ResultCache
+
+
+class BatchTest(unittest.TestCase):
+    def setUp(self):
+        # Path 1-2-3-4 with a triangle 4-5-6 at its end
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "graph.edges")
+        with open(self.file_path, 'w') as file:
+            file.write("1 2\n2 3\n3 4\n4 5\n5 6\n6 4\n")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_run_job(self):
+        for solver in ("DFS", "Branch and Bound", "Exact"):
+            row = Main.run_job((self.file_path, solver, 10))
+            self.assertEqual(row['length'], 5, solver)
+            self.assertTrue(row['optimal'], solver)
+            self.assertEqual(row['lcc_size'], 6)
+            self.assertEqual(row['optimality_gap'], 0)
+            self.assertEqual(len(row['path']), 6)
+
+    def test_cached_solve(self):
+        graph = GraphCache(self.file_path).load()
+        results = ResultCache(os.path.join(self.directory.name, "results.sqlite"))
+        runs = []
+
+        def solve(path, optimal):
+            def run():
+                runs.append(path)
+                return path, optimal, {}
+            return run
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            # A time-limited result is stored for the warm start but solved again, keeping the longest path
+            Main.cached_solve(graph, results, "graph", "GRASP", {}, solve([0, 1, 2], False), deterministic=False)
+            _, _, _, _, cached = Main.cached_solve(graph, results, "graph", "GRASP", {}, solve([0, 1], False),
+                                                   deterministic=False)
+            self.assertFalse(cached)
+            self.assertEqual(results.best_path("graph"), graph.to_labels([0, 1, 2]))
+            # A proven optimum and a deterministic solver's result are reused
+            Main.cached_solve(graph, results, "graph", "Exact", {}, solve([0, 1, 2, 3], True), deterministic=False)
+            Main.cached_solve(graph, results, "graph", "DFS", {}, solve([1, 2], False))
+            path, _, optimal, _, cached = Main.cached_solve(graph, results, "graph", "Exact", {},
+                                                            solve([0], False), deterministic=False)
+            self.assertEqual((path, optimal, cached), ([0, 1, 2, 3], True, True))
+            self.assertTrue(Main.cached_solve(graph, results, "graph", "DFS", {}, solve([0], False))[4])
+        results.close()
+        self.assertEqual(runs, [[0, 1, 2], [0, 1], [0, 1, 2, 3], [1, 2]])
+
+    def test_cached_solve_keys_on_solver_version(self):
+        graph = GraphCache(self.file_path).load()
+        results = ResultCache(os.path.join(self.directory.name, "results.sqlite"))
+        versions = dict(Main.solver_versions)
+        self.addCleanup(Main.solver_versions.update, versions)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            Main.cached_solve(graph, results, "graph", "DFS", {}, lambda: ([0, 1], False, {}))
+            self.assertTrue(Main.cached_solve(graph, results, "graph", "DFS", {}, lambda: ([0], False, {}))[4])
+            # A new version of the solver solves again instead of reusing the old code's result
+            Main.solver_versions["DFS"] = "changed"
+            path, _, _, _, cached = Main.cached_solve(graph, results, "graph", "DFS", {}, lambda: ([2], False, {}))
+        results.close()
+        self.assertEqual((path, cached), ([2], False))
+
+    def test_radius_sweep(self):
+        file_path = os.path.join(self.directory.name, "sweep.edges")
+        with contextlib.redirect_stdout(io.StringIO()):
+            Main.radius_sweep(60, [0.5, 0.6], file_path)
+        graph = Graph()
+        graph.read_graph_from_file(file_path)
+        self.assertIn(len(graph.largest_component()), range(30, 37))
+
+        # No component size lies between 5.5 and 5.6, so every point set skips the interval
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            Main.radius_sweep(10, [0.55, 0.56], os.path.join(self.directory.name, "none.edges"), point_sets=3)
+        self.assertIn("gave up after 3 point sets", output.getvalue())
+        self.assertFalse(os.path.exists(os.path.join(self.directory.name, "none.edges")))
+
+    def test_parse_arguments(self):
+        pattern = os.path.join(self.directory.name, "*.edges")
+        files, arguments, time_limits = Main.parse_arguments(
+            [pattern, "--solvers", "DFS", "GRASP", "--timeout", "5", "--solver-timeout", "GRASP=2"])
+
+        self.assertEqual(files, [self.file_path])
+        self.assertEqual(arguments.solvers, ["DFS", "GRASP"])
+        self.assertEqual(time_limits, {"DFS": 5, "GRASP": 2})
+
+        _, _, time_limits = Main.parse_arguments(
+            [pattern, "--solvers", "DFS", "GRASP", "--timeout", "none", "--solver-timeout", "GRASP=0"])
+        self.assertEqual(time_limits, {"DFS": None, "GRASP": None})
+
+    def test_parse_arguments_errors(self):
+        pattern = os.path.join(self.directory.name, "*.edges")
+        for setting in ("GRASP=abc", "GRASP", "GRASP=-1", "Unknown=5"):
+            with self.assertRaises(SystemExit), contextlib.redirect_stderr(io.StringIO()):
+                Main.parse_arguments([pattern, "--solver-timeout", setting])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+from Graph import Graph
+from Portfolio import Portfolio
+
+
+class PortfolioTest(unittest.TestCase):
+    def setUp(self):
+        # Initialize the graph
+        self.graph = Graph()
+
+        edges = [(2, 3), (3, 4), (4, 5), (3, 6), (1, 7), (7, 8),
+                 (8, 9), (9, 10), (10, 11), (11, 12), (7, 9), (8, 10)]
+
+        # Add vertices with coordinates for A*
+        for i in range(1, 13):
+            self.graph.add_vertex_with_coordinates(i, (i / 12, (i % 3) / 3))
+
+        for u, v in edges:
+            self.graph.add_edge(u, v)
+
+        # Largest connected component of the graph above
+        self.lcc = [1, 7, 8, 9, 10, 11, 12]
+
+    def test_run_stops_at_upper_bound(self):
+        portfolio = Portfolio(self.graph, self.lcc, time_limit=30)
+        length, path, solver, proven = portfolio.run()
+
+        self.assertEqual(length, 6, "The longest path should visit the whole component")
+        self.assertEqual(len(path), len(set(path)), "Path should not contain duplicate nodes")
+        self.assertTrue(all(path[i + 1] in self.graph.vertices[path[i]] for i in range(len(path) - 1)))
+        self.assertTrue(proven)
+        self.assertIn(solver, Portfolio.all_solvers)
+        self.assertEqual(portfolio.history[-1][1:], (solver, 7))
+
+    def test_exact_solver_proves_optimality(self):
+        # Without the trivial bound, only Branch and Bound can end the run before the time limit
+        portfolio = Portfolio(self.graph, self.lcc, time_limit=30, upper_bound=8,
+                              solvers=["DFS", "Branch and Bound"])
+        length, _, _, proven = portfolio.run()
+
+        self.assertEqual(length, 6)
+        self.assertTrue(proven)
+        self.assertTrue(portfolio.finished["Branch and Bound"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+from Graph import Graph
+from Reduction import Reduction
+
+
+class ReductionTest(unittest.TestCase):
+    def setUp(self):
+        # Initialize the graph: a 6-cycle with a chord, two pendant trees and a separate edge
+        self.graph = Graph()
+
+        edges = [(1, 2), (2, 3), (3, 4), (4, 5), (5, 6), (6, 1), (2, 5),
+                 (1, 7), (7, 8), (4, 9), (9, 10), (9, 11), (12, 13)]
+
+        # Add vertices
+        for i in range(1, 14):
+            self.graph.add_vertex(i)
+
+        for u, v in edges:
+            self.graph.add_edge(u, v)
+
+        # Largest connected component of the graph above
+        self.lcc = list(range(1, 12))
+        self.reduction = Reduction(self.graph, self.lcc)
+
+    def test_pendant_trees_are_peeled(self):
+        self.assertEqual(self.reduction.parent, {8: 7, 7: 1, 10: 9, 11: 9, 9: 4})
+        self.assertEqual(self.reduction.tail_path(1), [1, 7, 8])
+
+    def test_chains_are_contracted(self):
+        self.assertEqual(self.reduction.branch, [1, 2, 4, 5])
+        self.assertIn((1, 5, [6]), self.reduction.chains)
+        self.assertIn((2, 4, [3]), self.reduction.chains)
+
+    def test_find_longest_path(self):
+        length, path, optimal = self.reduction.find_longest_path()
+
+        self.assertEqual(length, 9, "Both tails and both chains should be on the path")
+        self.assertEqual(len(path), length + 1)
+        self.assertEqual(len(path), len(set(path)), "Path should not contain duplicate nodes")
+        self.assertTrue(all(path[i + 1] in self.graph.vertices[path[i]] for i in range(len(path) - 1)))
+        self.assertTrue(optimal)
+
+    def test_invalid_incumbent_is_ignored(self):
+        self.assertEqual(Reduction(self.graph, self.lcc, incumbent=[8, 1, 2]).incumbent, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
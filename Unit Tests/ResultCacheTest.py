@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+from ResultCache import ResultCache
+
+
+class ResultCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ResultCache(os.path.join(self.directory.name, "results.sqlite"), max_entries=2)
+
+    def tearDown(self):
+        self.cache.close()
+        self.directory.cleanup()
+
+    def test_get_returns_stored_result(self):
+        self.cache.put("graph", "GRASP", {'seed': 0, 'iterations': 20}, [10, 20, 30], 3, 1.5,
+                       details={'iterations': 20})
+        result = self.cache.get("graph", "GRASP", {'iterations': 20, 'seed': 0})
+
+        self.assertEqual(result['path'], [10, 20, 30])
+        self.assertEqual(result['seconds'], 1.5)
+        self.assertFalse(result['optimal'])
+        self.assertEqual(result['details'], {'iterations': 20})
+        self.assertIsNone(self.cache.get("graph", "GRASP", {'iterations': 20, 'seed': 1}))
+        self.assertIsNone(self.cache.get("other graph", "GRASP", {'iterations': 20, 'seed': 0}))
+
+    def test_least_recently_used_is_evicted(self):
+        self.cache.put("graph", "DFS", {}, [1, 2], 2, 0.1)
+        self.cache.put("graph", "DijkstraMax", {}, [1, 2, 3], 3, 0.1)
+        self.cache.get("graph", "DFS")  # DijkstraMax is now the least recently used
+        self.cache.put("graph", "A*", {}, [4, 5], 2, 0.1)
+
+        self.assertIsNotNone(self.cache.get("graph", "DFS"))
+        self.assertIsNone(self.cache.get("graph", "DijkstraMax"))
+        self.assertIsNotNone(self.cache.get("graph", "A*"))
+
+    def test_best_path_is_warm_incumbent(self):
+        self.cache.put("graph", "DFS", {}, [1, 2], 2, 0.1)
+        self.cache.put("graph", "A*", {}, [3, 1, 2], 3, 0.1)
+        self.assertEqual(self.cache.best_path("graph"), [3, 1, 2])
+        self.assertEqual(self.cache.best_path("other graph"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import os
 import unittest
 from DijkstraMax import DijkstraMax
 from Graph import Graph
@@ -32,6 +33,13 @@ class TestDijkstraMax(unittest.TestCase):
         self.assertEqual(self.dijkstra.distances[2], 1)
         self.assertEqual(self.dijkstra.predecessors[2], 1)
 
+    def test_state_is_reset_between_sources(self):
+        self.dijkstra.dijkstra_max(1)
+        path, length = self.dijkstra.dijkstra_max(2)
+        self.assertEqual(length, 3)  # 2 -> 3 -> 4 -> 5
+        self.assertEqual(self.dijkstra.distances[7], float('-inf'), "Vertices of the previous source must be cleared")
+        self.assertIsNone(self.dijkstra.predecessors[8])
+
     def test_get_longest_path(self):
         # Test finding the longest path in the graph
         longest_path_length, longest_path = self.dijkstra.get_longest_path()
@@ -43,6 +51,59 @@ class TestDijkstraMax(unittest.TestCase):
                          "The length of the path did not match the expected value.")
         self.assertEqual(longest_path, expected_path, "The path did not match the expected path.")
 
+    def test_stops_at_upper_bound(self):
+        sources = []
+        dijkstra_max = self.dijkstra.dijkstra_max
+        self.dijkstra.dijkstra_max = lambda s: sources.append(s) or dijkstra_max(s)
+
+        # The first source already finds 7 vertices, so no other source is tried
+        self.assertEqual(self.dijkstra.get_longest_path(upper_bound=7), (6, [1, 7, 8, 9, 10, 11, 12]))
+        self.assertEqual(sources, [1])
+        sources.clear()
+        self.assertEqual(self.dijkstra.get_longest_path(upper_bound=8), (6, [1, 7, 8, 9, 10, 11, 12]))
+        self.assertEqual(len(sources), 12, "A bound no path reaches searches from every source")
+
+    def test_parallel_stops_at_upper_bound(self):
+        for upper_bound in (4, 7, 8):
+            serial = DijkstraMax(self.graph).get_longest_path(upper_bound=upper_bound)
+            parallel = DijkstraMax(self.graph, workers=2).get_longest_path(upper_bound=upper_bound)
+            self.assertEqual(parallel, serial, upper_bound)
+
+
+class TestDijkstraMaxBaseline(unittest.TestCase):
+    """Path lengths of the original PriorityQueueNode implementation on the bundled graphs."""
+
+    graphs = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Graphs")
+    # Longest path length from each of the first LCC vertices as a source
+    first_sources = {
+        "DSJC500-5.mtx": [498, 498, 498, 498, 498],
+        "inf-euroroad.edges": [295, 223, 296, 224, 250, 230, 230, 234, 224, 224],
+        "inf-power.mtx": [959, 900, 844, 901, 810],
+        "random_geometric_graph_OUTPUT.edges": [10, 12, 11, 11, 10, 11, 13, 11, 13, 12],
+        "random_geometric_graph_OUTPUT_1.edges": [109, 109, 121, 109, 99, 110, 110, 114, 103, 116],
+        "random_geometric_graph_OUTPUT_2.edges": [113, 112, 113, 113, 114, 106, 114, 114, 107, 101],
+        "random_geometric_graph_OUTPUT_3.edges": [105, 118, 107, 105, 105, 106, 106, 109, 109, 107],
+        "simple_graph_1.edges": [6, 6, 6, 6, 6, 6, 5],
+        "simple_graph_2.edges": [9, 9, 9, 9, 9, 9, 9, 9, 9, 7],
+    }
+
+    def load(self, name):
+        graph = Graph()
+        graph.read_graph_from_file(os.path.join(self.graphs, name))
+        return graph.compile()
+
+    def test_lengths_match_baseline(self):
+        for name, expected in self.first_sources.items():
+            graph = self.load(name)
+            lcc = graph.largest_component()
+            dijkstra = DijkstraMax(graph, lcc)
+            lengths = [dijkstra.dijkstra_max(s)[1] for s in lcc[:len(expected)]]
+            self.assertEqual(lengths, expected, name)
+
+    def test_longest_path_matches_baseline(self):
+        graph = self.load("inf-euroroad.edges")
+        self.assertEqual(DijkstraMax(graph, graph.largest_component()).get_longest_path()[0], 323)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+from Graph import Graph
+from UnionFind import UnionFind
+
+
+class UnionFindTest(unittest.TestCase):
+    def setUp(self):
+        # Two components {0, 1, 2, 3} and {4, 5} plus the isolated vertex 6
+        self.components = UnionFind(7)
+        for u, v in [(0, 1), (1, 2), (3, 2), (4, 5), (0, 2)]:
+            self.components.union(u, v)
+
+    def test_union(self):
+        self.assertEqual(self.components.find(3), self.components.find(0))
+        self.assertNotEqual(self.components.find(4), self.components.find(0))
+        self.assertFalse(self.components.union(1, 3), "Union of the same set should report no merge")
+
+    def test_largest_component(self):
+        self.assertEqual(self.components.largest, 4)
+        self.assertEqual(self.components.largest_component(), [0, 1, 2, 3])
+
+    def test_size_histogram(self):
+        self.assertEqual(self.components.size_histogram(), {1: 1, 2: 1, 4: 1})
+
+    def test_array_storage(self):
+        # The same sets kept in int arrays, grown with add like the streaming loader does
+        components = UnionFind(typecode='i')
+        self.assertEqual(components.add(7), 0)
+        for u, v in [(0, 1), (1, 2), (3, 2), (4, 5), (0, 2)]:
+            components.union(u, v)
+        self.assertEqual(components.parent.typecode, 'i')
+        self.assertEqual(components.largest_component(), [0, 1, 2, 3])
+        self.assertEqual(components.size_histogram(), self.components.size_histogram())
+
+    def test_graph_tracks_components_while_loading(self):
+        graph = Graph(track_components=True)
+        for i in range(6):
+            graph.add_vertex(i)
+        for u, v in [(0, 1), (2, 3), (3, 4)]:
+            graph.add_edge(u, v)
+
+        self.assertIs(graph.connected_components(), graph.components)
+        self.assertEqual(graph.largest_component(), [2, 3, 4])
+        self.assertEqual(graph.component_size_histogram(), {1: 1, 2: 1, 3: 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
+import random
 import unittest
 from DijkstraMax import DijkstraMax
 from Graph import Graph
+from aStar import aStar
 
 
 class aStarTest(unittest.TestCase):
@@ -45,5 +47,66 @@ class aStarTest(unittest.TestCase):
         self.assertEqual(longest_path, expected_path, "The path did not match the expected path.")
 
 
+class aStarPrunedTest(unittest.TestCase):
+    def setUp(self):
+        # A 3x3 grid of unit-spaced points with every horizontal and vertical edge
+        self.graph = Graph()
+        for i in range(9):
+            self.graph.add_vertex_with_coordinates(i, (i % 3, i // 3))
+        for i in range(9):
+            if i % 3 < 2:
+                self.graph.add_edge(i, i + 1)
+            if i < 6:
+                self.graph.add_edge(i, i + 3)
+        self.lcc = list(range(9))
+        self.astar = aStar(self.graph, self.lcc)
+
+    def test_periphery_candidates(self):
+        self.assertEqual(sorted(self.astar.periphery_candidates(4)), [0, 2, 6, 8], "The corners are farthest out")
+
+    def test_pair_budget(self):
+        length, path = self.astar.find_longest_simple_path_pruned(max_pairs=6)
+
+        self.assertEqual(len(path), len(set(path)), "Path should not contain duplicate nodes")
+        self.assertTrue(all(path[i + 1] in self.graph.vertices[path[i]] for i in range(len(path) - 1)))
+        self.assertAlmostEqual(length, len(path) - 1, msg="Every edge of the grid has length 1")
+        self.assertLessEqual(len(self.astar.heuristics), 4, "Only candidate targets need a heuristic")
+
+    def test_pruned_pairs_search_both_directions(self):
+        pairs = list(self.astar.pruned_pairs(max_pairs=6, candidates=[0, 4, 8]))
+        self.assertEqual(len(pairs), 6)
+        self.assertEqual(set(pairs), {(s, d) for s in (0, 4, 8) for d in (0, 4, 8) if s != d})
+
+
+class aStarGeometricTest(unittest.TestCase):
+    def setUp(self):
+        # A random geometric graph: no symmetry, so the search from s to d and the one from d to s differ
+        random.seed(11)
+        self.graph = Graph()
+        self.graph.generate_random_geometric_graph(40, 0.3)
+        self.lcc = self.graph.largest_component()
+
+    def test_full_search_matches_pruned_over_all_vertices(self):
+        full = aStar(self.graph, self.lcc).find_longest_simple_path()
+        pairs = len(self.lcc) * (len(self.lcc) - 1)
+        pruned = aStar(self.graph, self.lcc).find_longest_simple_path_pruned(max_pairs=pairs, candidates=self.lcc)
+        self.assertEqual(pruned, full)
+
+    def test_full_search_computes_each_heuristic_once(self):
+        # With targets in the outer loop even a two-target cache never computes a heuristic twice
+        astar = aStar(self.graph, self.lcc)
+        astar.heuristic_cache_size = 2
+        targets = []
+        heuristic_to = astar.heuristic_to
+
+        def counting_heuristic_to(d):
+            if d not in astar.heuristics:
+                targets.append(d)
+            return heuristic_to(d)
+
+        astar.heuristic_to = counting_heuristic_to
+        astar.find_longest_simple_path()
+        self.assertEqual(sorted(targets), sorted(self.lcc))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -4,9 +4,16 @@ import random
 
 
 class aStar:
+    heuristic_cache_size = 64  # Targets whose heuristic values are kept between searches
+
     def __init__(self, graph, lcc):
         self.graph = graph
         self.lcc = lcc
+        self.in_lcc = graph.new_vertex_state(False)
+        for vertex in lcc:
+            self.in_lcc[vertex] = True
+        self.edge_lengths = None  # Vertex -> {LCC neighbor: edge length}, filled on the first search
+        self.heuristics = {}  # Target -> heuristic state, oldest target evicted first
 
     def euclidean_distance(self, coord1, coord2):
         return math.sqrt((coord1[0] - coord2[0]) ** 2 + (coord1[1] - coord2[1]) ** 2)
@@ -20,29 +27,51 @@ class aStar:
         coord_v = self.graph.get_coordinates(v)
         return self.euclidean_distance(coord_u, coord_v)
 
+    def precompute_edge_lengths(self):
+        # Every LCC edge length computed once, keeping the neighbor order of the graph
+        self.edge_lengths = self.graph.new_vertex_state(None)
+        for u in self.lcc:
+            self.edge_lengths[u] = {v: self.edge_length(u, v) for v in self.graph.vertices[u] if self.in_lcc[v]}
+
+    def heuristic_to(self, d):
+        heuristic = self.heuristics.get(d)
+        if heuristic is None:
+            heuristic = self.graph.new_vertex_state(0)
+            for vertex in self.lcc:
+                heuristic[vertex] = self.modified_heuristic(vertex, d)
+            if len(self.heuristics) >= self.heuristic_cache_size:
+                del self.heuristics[next(iter(self.heuristics))]
+            self.heuristics[d] = heuristic
+        return heuristic
+
+    def path_length(self, path):
+        return sum(self.edge_lengths[path[i]][path[i + 1]] for i in range(len(path) - 1))
+
     def a_star_longest_path(self, s, d):
-        if s not in self.lcc or d not in self.lcc:
+        if s not in self.graph.vertices or d not in self.graph.vertices or not self.in_lcc[s] or not self.in_lcc[d]:
             return None
+        if self.edge_lengths is None:
+            self.precompute_edge_lengths()
 
-        distances = {vertex: float('-inf') for vertex in self.lcc}
-        heuristic = {vertex: self.modified_heuristic(vertex, d) for vertex in self.lcc}
+        distances = self.graph.new_vertex_state(float('-inf'))
+        heuristic = self.heuristic_to(d)
         distances[s] = 0
 
         queue = []
         heapq.heappush(queue, (-(distances[s] + heuristic[s]), s))  # Maximize path length
 
-        visited = set()
-        predecessor = {vertex: None for vertex in self.lcc}
+        visited = self.graph.new_vertex_state(False)
+        predecessor = self.graph.new_vertex_state(None)
 
         while queue:
             _, current = heapq.heappop(queue)
-            visited.add(current)
+            visited[current] = True
             if current == d:
                 break
 
-            for neighbor in self.graph.vertices[current]:
-                if neighbor in self.lcc and neighbor not in visited:
-                    new_distance = distances[current] + self.edge_length(current, neighbor)
+            for neighbor, length in self.edge_lengths[current].items():
+                if not visited[neighbor]:
+                    new_distance = distances[current] + length
                     if new_distance > distances[neighbor]:
                         distances[neighbor] = new_distance
                         predecessor[neighbor] = current
@@ -58,17 +87,63 @@ class aStar:
         return path
 
     def find_longest_simple_path(self):
-        longest_path = []
-        longest_path_length = 0
-
-        for start_vertex in self.lcc:
-            for end_vertex in self.lcc:
-                if start_vertex != end_vertex:
-                    path = self.a_star_longest_path(start_vertex, end_vertex)
-                    if path:
-                        path_length = sum(self.edge_length(path[i], path[i + 1]) for i in range(len(path) - 1))
-                        if path_length > longest_path_length:
-                            longest_path_length = path_length
-                            longest_path = path
-
-        return longest_path_length, longest_path
+        for _ in self.incumbents():
+            pass
+        return self.longest_path_length, self.longest_path
+
+    def incumbents(self, token=None, pairs=None):
+        """Yield the longest path so far (by Euclidean length) each time an endpoint pair improves it.
+
+        Searches every ordered pair of LCC vertices unless `pairs` gives the (start, end) pairs, and stops
+        when the token expires. The target varies in the outer loop, so each target's heuristic is computed once."""
+        if pairs is None:
+            pairs = ((s, d) for d in self.lcc for s in self.lcc if s != d)
+        self.longest_path = []
+        self.longest_path_length = 0
+
+        for start_vertex, end_vertex in pairs:
+            if token is not None and token.expired():
+                return
+            path = self.a_star_longest_path(start_vertex, end_vertex)
+            if path:
+                path_length = self.path_length(path)
+                if path_length > self.longest_path_length:
+                    self.longest_path_length = path_length
+                    self.longest_path = path
+                    yield path
+
+    def periphery_candidates(self, count):
+        """The `count` LCC vertices farthest from the center of the LCC's coordinate extent."""
+        coordinates = [self.graph.get_coordinates(vertex) for vertex in self.lcc]
+        xs = [x for x, _ in coordinates]
+        ys = [y for _, y in coordinates]
+        center = ((min(xs) + max(xs)) / 2, (min(ys) + max(ys)) / 2)
+        order = sorted(range(len(self.lcc)), key=lambda i: self.euclidean_distance(coordinates[i], center),
+                       reverse=True)
+        return [self.lcc[i] for i in order[:count]]
+
+    def pruned_pairs(self, max_pairs=200, candidates=None):
+        """Ordered (start, end) pairs of candidate endpoints, at most max_pairs.
+
+        Both directions of a pair are searched, since the heuristic depends on the target and the search from
+        d to s need not find the reverse of the path from s to d. Without explicit candidates, the periphery
+        vertices are used, as many as the budget can pair up. Targets vary in the outer loop, so each target's
+        heuristic is computed once."""
+        if candidates is None:
+            count = int((1 + math.sqrt(1 + 4 * max_pairs)) / 2)  # count * (count - 1) <= max_pairs
+            candidates = self.periphery_candidates(count) if self.lcc else []
+        pairs = 0
+        for end_vertex in candidates:
+            for start_vertex in candidates:
+                if start_vertex == end_vertex:
+                    continue
+                if pairs == max_pairs:
+                    return
+                pairs += 1
+                yield start_vertex, end_vertex
+
+    def find_longest_simple_path_pruned(self, max_pairs=200, candidates=None):
+        """Like find_longest_simple_path, over the endpoint pairs of pruned_pairs."""
+        for _ in self.incumbents(pairs=self.pruned_pairs(max_pairs, candidates)):
+            pass
+        return self.longest_path_length, self.longest_path